@@ -1,11 +1,171 @@
-from typing import TypeVar, List
+from typing import TypeVar, List, Callable, Sequence, Any
 
 T = TypeVar("T")
 
 
-def binary_search(array: List[T], key: T, low: int, high: int) -> int:
+def lower_bound(
+    array: Sequence[T],
+    value: Any,
+    low: int = 0,
+    high: int | None = None,
+    *,
+    key: Callable[[T], Any] | None = None,
+) -> int:
+    """Return the leftmost insertion point for value in the sorted array.
+
+    Every element in array[low:index] is less than value and every element in
+    array[index:high] is greater than or equal to value, same as bisect.bisect_left.
+    If value is present, index is the position of its first occurrence.
+
+    Note: Array need to be sorted (by key, if key is given).
+
+    Time complexity: O(log(n))
+
+    Args:
+        array (Sequence[T]): The sorted sequence to be searched.
+        value (Any): Value to be searched for, compared against key(element).
+        low (int): Lower (start) index of the search range.
+        high (int | None): Upper (exclusive) index of the search range, len(array) by default.
+        key (Callable[[T], Any] | None): Projection applied to elements before comparison.
+
+    Returns:
+        (int): Insertion point of value in the range [low, high].
+    """
+    if low < 0:
+        raise ValueError("low must be non-negative")
+    if high is None:
+        high = len(array)
+    if key is None:
+        while low < high:
+            mid = (low + high) // 2
+            if array[mid] < value:
+                low = mid + 1
+            else:
+                high = mid
+    else:
+        while low < high:
+            mid = (low + high) // 2
+            if key(array[mid]) < value:
+                low = mid + 1
+            else:
+                high = mid
+    return low
+
+
+def upper_bound(
+    array: Sequence[T],
+    value: Any,
+    low: int = 0,
+    high: int | None = None,
+    *,
+    key: Callable[[T], Any] | None = None,
+) -> int:
+    """Return the rightmost insertion point for value in the sorted array.
+
+    Every element in array[low:index] is less than or equal to value and every
+    element in array[index:high] is greater than value, same as bisect.bisect_right.
+
+    Note: Array need to be sorted (by key, if key is given).
+
+    Time complexity: O(log(n))
+
+    Args:
+        array (Sequence[T]): The sorted sequence to be searched.
+        value (Any): Value to be searched for, compared against key(element).
+        low (int): Lower (start) index of the search range.
+        high (int | None): Upper (exclusive) index of the search range, len(array) by default.
+        key (Callable[[T], Any] | None): Projection applied to elements before comparison.
+
+    Returns:
+        (int): Insertion point after the last occurrence of value in the range [low, high].
+    """
+    if low < 0:
+        raise ValueError("low must be non-negative")
+    if high is None:
+        high = len(array)
+    if key is None:
+        while low < high:
+            mid = (low + high) // 2
+            if value < array[mid]:
+                high = mid
+            else:
+                low = mid + 1
+    else:
+        while low < high:
+            mid = (low + high) // 2
+            if value < key(array[mid]):
+                high = mid
+            else:
+                low = mid + 1
+    return low
+
+
+def equal_range(
+    array: Sequence[T],
+    value: Any,
+    low: int = 0,
+    high: int | None = None,
+    *,
+    key: Callable[[T], Any] | None = None,
+) -> tuple[int, int]:
+    """Return the half-open range [first, last) of elements equal to value.
+
+    The range is empty (first == last == insertion point) if value is not present.
+
+    Note: Array need to be sorted (by key, if key is given).
+
+    Time complexity: O(log(n))
+
+    Args:
+        array (Sequence[T]): The sorted sequence to be searched.
+        value (Any): Value to be searched for, compared against key(element).
+        low (int): Lower (start) index of the search range.
+        high (int | None): Upper (exclusive) index of the search range, len(array) by default.
+        key (Callable[[T], Any] | None): Projection applied to elements before comparison.
+
+    Returns:
+        (tuple[int, int]): Lower bound and upper bound of value.
+    """
+    first = lower_bound(array, value, low, high, key=key)
+    last = upper_bound(array, value, first, high, key=key)
+    return (first, last)
+
+
+def binary_search(
+    array: List[T], key: T, low: int = 0, high: int | None = None
+) -> int:
     """Binary searching.
 
+    Narrows the range [low, high] in a loop until the first element not less than key
+    is found, then checks whether it equals key. With duplicates, the index of the first
+    occurrence is returned.
+
+    Note: Array need to be sorted.
+
+    Time complexity: O(log(n))
+
+    Args:
+        array (List[T]): The sorted list to be searched.
+        key (T): Element to be search for in the list.
+        low (int): Lower (start) index of the list.
+        high (int | None): Higher (end) index of the list, len(array) - 1 by default.
+
+    Returns:
+        (int): Index of the key element if present in the list, otherwise -1.
+    """
+    if high is None:
+        high = len(array) - 1
+    if low > high:
+        return -1
+    idx = lower_bound(array, key, low, high + 1)
+    if idx <= high and array[idx] == key:
+        return idx
+    return -1
+
+
+def binary_search_recursive(array: List[T], key: T, low: int, high: int) -> int:
+    """Recursive binary searching, kept as a reference for benchmarks.
+
     Calculates middle index of list and compare key against value at middle index of array.
     If key is found at middle index, then returns middle index.
     If key is smaller than the value at middle index, searches key against array left to middle index.
@@ -28,13 +188,12 @@ def binary_search(array: List[T], key: T, low: int, high: int) -> int:
     if low > high:
         return -1
     mid: int = (high + low + 1) // 2
-    print(f"mid: {mid}")
     if key == array[mid]:
         return mid
     elif key < array[mid]:
-        return binary_search(array, key, low, mid - 1)
+        return binary_search_recursive(array, key, low, mid - 1)
     else:
-        return binary_search(array, key, mid + 1, high)
+        return binary_search_recursive(array, key, mid + 1, high)
 
 
 if __name__ == "__main__":
@@ -43,3 +202,27 @@ if __name__ == "__main__":
     print(binary_search(arr, 1, 0, len(arr) - 1))
     print(binary_search(arr, 15, 0, len(arr) - 1))
     print(binary_search(arr, 19, 0, len(arr) - 1))
+
+    dup: List[int] = [1, 2, 2, 2, 3, 5, 5, 8]
+    print(f"lower_bound of 2: {lower_bound(dup, 2)}")
+    print(f"upper_bound of 2: {upper_bound(dup, 2)}")
+    print(f"equal_range of 5: {equal_range(dup, 5)}")
+    print(f"equal_range of 4: {equal_range(dup, 4)}")
+
+    records = [(1, "a"), (4, "b"), (4, "c"), (9, "d")]
+    print(f"lower_bound of key 4: {lower_bound(records, 4, key=lambda r: r[0])}")
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 4
+    # 0
+    # 7
+    # -1
+    # lower_bound of 2: 1
+    # upper_bound of 2: 4
+    # equal_range of 5: (5, 7)
+    # equal_range of 4: (5, 5)
+    # lower_bound of key 4: 1
+
+    ###########################################################################
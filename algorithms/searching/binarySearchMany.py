@@ -0,0 +1,94 @@
+from array import array
+from typing import Any, Iterable, Sequence
+
+from binarySearch import lower_bound
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, fall back to a per-key loop
+    np = None
+
+
+def binary_search_many(sorted_array: Any, keys: Any) -> Any:
+    """Search all keys in the sorted array in one pass.
+
+    With numpy available, the sorted array and the keys are viewed as numpy arrays
+    (numpy arrays, array.array, memoryview or any other buffer-protocol object work
+    without copying) and all keys are resolved by a single vectorized searchsorted.
+    Without numpy, every key is searched with lower_bound.
+
+    With duplicates, the index of the first occurrence is returned, same as binary_search.
+
+    Note: Array need to be sorted.
+
+    Time complexity: O(m log(n)) for m keys.
+
+    Args:
+        sorted_array (Any): The sorted one-dimensional array to be searched.
+        keys (Any): Keys to be searched for.
+
+    Returns:
+        (Any): Index of every key, -1 for missing keys. A numpy intp array if numpy is
+            available, otherwise an array.array of typecode "q".
+    """
+    if np is None:
+        return _binary_search_many_loop(_as_sequence(sorted_array), _as_sequence(keys))
+
+    haystack = _as_ndarray(sorted_array)
+    needles = _as_ndarray(keys)
+    if haystack.ndim != 1:
+        raise ValueError("sorted_array must be one-dimensional")
+    result = np.full(needles.shape, -1, dtype=np.intp)
+    n = haystack.shape[0]
+    if n == 0:
+        return result
+    idx = np.searchsorted(haystack, needles, side="left")
+    candidate = np.minimum(idx, n - 1)
+    found = (idx < n) & (haystack[candidate] == needles)
+    result[found] = idx[found]
+    return result
+
+
+def _as_ndarray(data: Any) -> Any:
+    """Return a numpy view of data, going through memoryview for raw buffers."""
+    if isinstance(data, np.ndarray):
+        return data
+    try:
+        return np.asarray(memoryview(data))
+    except TypeError:
+        return np.asarray(data)
+
+
+def _as_sequence(data: Any) -> Sequence:
+    """Return an indexable sequence for lists, tuples and buffer-protocol objects."""
+    if isinstance(data, (bytes, bytearray)):
+        return data
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return data if isinstance(data, Sequence) else list(data)
+    if view.ndim != 1:
+        raise ValueError("buffers must be one-dimensional")
+    return view
+
+
+def _binary_search_many_loop(sorted_array: Sequence, keys: Iterable) -> array:
+    """Search every key with lower_bound and collect the indices."""
+    n = len(sorted_array)
+    result = array("q")
+    for key in keys:
+        idx = lower_bound(sorted_array, key)
+        result.append(idx if idx < n and sorted_array[idx] == key else -1)
+    return result
+
+
+if __name__ == "__main__":
+    arr = array("l", [1, 3, 5, 7, 9, 11, 13, 15])
+    print([int(i) for i in binary_search_many(arr, [9, 1, 15, 19, 0, 8])])
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # [4, 0, 7, -1, -1, -1]
+
+    ###########################################################################
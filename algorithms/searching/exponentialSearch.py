@@ -0,0 +1,86 @@
+from typing import TypeVar, Sequence
+
+from binarySearch import lower_bound
+
+T = TypeVar("T")
+
+
+def exponential_search(
+    array: Sequence[T], key: T, low: int = 0, high: int | None = None
+) -> int:
+    """Exponential (galloping) searching.
+
+    Probes indices low + 1, low + 2, low + 4, ... until an element not less than key is
+    found, then binary searches the last doubled range. Keys near the front of the array
+    are found in O(log(i)) probes, where i is the distance of the key from low.
+
+    If array has no len() and high is not given, it is treated as unbounded: it must be
+    indexable at every probed position (e.g. an infinite monotone sequence).
+
+    With duplicates, the index of the first occurrence is returned, same as binary_search.
+
+    Note: Array need to be sorted.
+
+    Time complexity: O(log(i))
+
+    Args:
+        array (Sequence[T]): The sorted sequence to be searched.
+        key (T): Element to be search for in the sequence.
+        low (int): Lower (start) index of the sequence.
+        high (int | None): Higher (end) index of the sequence, len(array) - 1 by default.
+
+    Returns:
+        (int): Index of the key element if present in the sequence, otherwise -1.
+    """
+    if high is None:
+        try:
+            high = len(array) - 1
+        except TypeError:
+            high = None  # unbounded
+    if high is not None and low > high:
+        return -1
+    if not array[low] < key:
+        return low if array[low] == key else -1
+
+    # array[prev] < key holds at the start of every round
+    prev, bound = low, 1
+    while True:
+        probe = low + bound
+        if high is not None and probe >= high:
+            probe = high
+            if array[probe] < key:
+                return -1
+            break
+        if not array[probe] < key:
+            break
+        prev = probe
+        bound *= 2
+    idx = lower_bound(array, key, prev + 1, probe + 1)
+    return idx if array[idx] == key else -1
+
+
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11, 13, 15]
+    print(exponential_search(arr, 9))
+    print(exponential_search(arr, 1))
+    print(exponential_search(arr, 15))
+    print(exponential_search(arr, 19))
+
+    class Squares:
+        """Unbounded sorted sequence of square numbers."""
+
+        def __getitem__(self, idx: int) -> int:
+            return idx * idx
+
+    print(exponential_search(Squares(), 1_000_000))
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 4
+    # 0
+    # 7
+    # -1
+    # 1000
+
+    ###########################################################################
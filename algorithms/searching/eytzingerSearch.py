@@ -0,0 +1,166 @@
+from array import array
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, batch lookups then loop over the keys
+    np = None
+
+
+class StaticSearchIndex:
+    """Read-only search index over a sorted sequence in Eytzinger (BFS) layout.
+
+    The element of in-order rank i is stored at the node of a complete binary tree
+    laid out level by level: node k has children 2k and 2k + 1. A search walks down
+    from node 1, so the first levels share a few cache lines and the next probes
+    are predictable, unlike the jumps of binary_search over a sorted array.
+
+    Indices returned by lookups are positions in the original sorted sequence.
+    """
+
+    __slots__ = ("_layout", "_ranks", "_n")
+
+    def __init__(self, sorted_values: Sequence, typecode: str | None = None) -> None:
+        """Build the index from sorted values.
+
+        Args:
+            sorted_values (Sequence): Values sorted in increasing order.
+            typecode (str | None): array.array typecode to store the layout in, e.g. "q"
+                or "d". By default numpy arrays are kept as numpy arrays and other
+                values are stored in a list.
+        """
+        n = len(sorted_values)
+        self._n = n
+        ranks = array("q", bytes(8 * (n + 1)))
+        ranks[0] = -1
+        # in-order walk of the implicit tree assigns consecutive ranks
+        stack: list[int] = []
+        k, rank = 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            ranks[k] = rank
+            rank += 1
+            k = 2 * k + 1
+        if np is not None and isinstance(sorted_values, np.ndarray):
+            self._ranks = np.frombuffer(ranks, dtype=np.int64)
+            layout = np.empty(n + 1, dtype=sorted_values.dtype)
+            layout[1:] = sorted_values[self._ranks[1:]]
+            if n:
+                layout[0] = layout[1]  # unused slot
+            self._layout = layout
+        else:
+            layout = [sorted_values[r] for r in ranks[1:]]
+            layout.insert(0, layout[0] if n else None)  # unused slot
+            self._ranks = ranks
+            self._layout = array(typecode, layout) if typecode and n else layout
+
+    def __len__(self) -> int:
+        """Return the number of indexed values."""
+        return self._n
+
+    def _descend(self, key: Any) -> int:
+        """Return the node holding the first value not less than key, or 0 if none."""
+        layout, n = self._layout, self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (layout[k] < key)
+        k = int(k)  # numpy comparisons make k a numpy integer
+        # drop the trailing right turns and the last left turn
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, key: Any) -> int:
+        """Return the leftmost insertion point for key in the sorted values."""
+        k = self._descend(key)
+        return int(self._ranks[k]) if k else self._n
+
+    def lookup(self, key: Any) -> int:
+        """Return the index of the first value equal to key, otherwise -1."""
+        k = self._descend(key)
+        if k and self._layout[k] == key:
+            return int(self._ranks[k])
+        return -1
+
+    def lookup_many(self, keys: Iterable) -> Any:
+        """Search all keys, descending the tree for all of them at once with numpy.
+
+        Args:
+            keys (Iterable): Keys to be searched for.
+
+        Returns:
+            (Any): Index of every key, -1 for missing keys. A numpy int64 array if numpy
+                is available, otherwise an array.array of typecode "q".
+        """
+        if np is None:
+            return array("q", (self.lookup(key) for key in keys))
+        keys = np.asarray(keys if isinstance(keys, np.ndarray) else list(keys))
+        layout = np.asarray(self._layout)
+        ranks = np.asarray(self._ranks)
+        n = self._n
+        k = np.ones(keys.shape, dtype=np.int64)
+        active = k <= n
+        while active.any():
+            nodes = k[active]
+            k[active] = 2 * nodes + (layout[nodes] < keys[active])
+            active = k <= n
+        # drop the trailing right turns and the last left turn
+        odd = (k & 1) == 1
+        while odd.any():
+            k[odd] >>= 1
+            odd = (k & 1) == 1
+        k >>= 1
+        found = (k > 0) & (layout[k] == keys)
+        return np.where(found, ranks[k], -1)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from binarySearch import binary_search
+    from binarySearchMany import binary_search_many
+
+    values = [1, 3, 3, 5, 7, 9, 11, 13, 15]
+    index = StaticSearchIndex(values, typecode="q")
+    print([index.lookup(key) for key in (9, 1, 3, 15, 19)])
+    print([index.lower_bound(key) for key in (0, 4, 16)])
+    print([int(i) for i in index.lookup_many([9, 1, 3, 15, 19])])
+
+    # 2^22 int64 keys (32 MiB) don't fit in L2 cache
+    n, lookups = 1 << 22, 200_000
+    sorted_values = list(range(0, 2 * n, 2))
+    keys = [random.randrange(2 * n) for _ in range(lookups)]
+    index = StaticSearchIndex(sorted_values, typecode="q")
+
+    start = time.perf_counter()
+    for key in keys:
+        binary_search(sorted_values, key)
+    print(f"\nbinary_search:                 {time.perf_counter() - start:.3f} s")
+    start = time.perf_counter()
+    for key in keys:
+        index.lookup(key)
+    print(f"StaticSearchIndex.lookup:      {time.perf_counter() - start:.3f} s")
+
+    if np is not None:
+        np_values = np.array(sorted_values, dtype=np.int64)
+        np_keys = np.array(keys, dtype=np.int64)
+        np_index = StaticSearchIndex(np_values)
+        start = time.perf_counter()
+        binary_search_many(np_values, np_keys)
+        print(f"binary_search_many:            {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        np_index.lookup_many(np_keys)
+        print(f"StaticSearchIndex.lookup_many: {time.perf_counter() - start:.3f} s")
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # [5, 0, 1, 8, -1]
+    # [0, 3, 9]
+    # [5, 0, 1, 8, -1]
+
+    # timings depend on the machine
+
+    ###########################################################################
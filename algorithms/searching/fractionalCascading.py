@@ -0,0 +1,139 @@
+from array import array
+from typing import Any, Iterable, Sequence
+
+from binarySearch import lower_bound
+
+
+class FractionalCascading:
+    """Search one key in many sorted lists with fractional cascading.
+
+    Level i is the merge of list i with every second element of level i + 1. Every
+    position of a level records how many of its elements before it come from list i
+    (the answer for list i) and how many were promoted from level i + 1 (where to
+    continue on the next level). One binary search on the first level is then
+    followed by O(1) work per list.
+
+    The lists are copied when building, later changes to them are not seen.
+    """
+
+    __slots__ = ("_levels", "_own", "_bridge", "_lists")
+
+    def __init__(self, lists: Iterable[Sequence]) -> None:
+        """Build the cascade bottom-up from k sorted lists.
+
+        Time complexity: O(total length of the lists)
+
+        Args:
+            lists (Iterable[Sequence]): Sorted lists to be searched.
+        """
+        self._lists: list[list] = [list(values) for values in lists]
+        k = len(self._lists)
+        self._levels: list[list] = [[] for _ in range(k)]
+        self._own: list[array] = [array("q") for _ in range(k)]
+        self._bridge: list[array] = [array("q") for _ in range(k)]
+        below: list = []
+        for i in range(k - 1, -1, -1):
+            level, own, bridge = self._merge(self._lists[i], below[1::2])
+            self._levels[i], self._own[i], self._bridge[i] = level, own, bridge
+            below = level
+
+    @staticmethod
+    def _merge(values: list, promoted: list) -> tuple[list, array, array]:
+        """Merge list values with promoted elements of the next level.
+
+        Returns:
+            (tuple[list, array, array]): The merged level and, for every position p,
+                the number of elements of values and of promoted in level[:p].
+        """
+        level: list = []
+        own = array("q", [0])
+        bridge = array("q", [0])
+        i = j = 0
+        while i < len(values) or j < len(promoted):
+            if j == len(promoted) or (i < len(values) and not promoted[j] < values[i]):
+                level.append(values[i])
+                i += 1
+            else:
+                level.append(promoted[j])
+                j += 1
+            own.append(i)
+            bridge.append(j)
+        return level, own, bridge
+
+    def __len__(self) -> int:
+        """Return the number of lists."""
+        return len(self._lists)
+
+    def search(self, key: Any) -> list[int]:
+        """Return the leftmost insertion point of key in every list.
+
+        Time complexity: O(log(n) + k)
+
+        Args:
+            key (Any): Key to be searched for.
+
+        Returns:
+            (list[int]): lower_bound of key in each list, in the order of the lists.
+        """
+        if not self._levels:
+            return []
+        result = []
+        p = lower_bound(self._levels[0], key)
+        for own, bridge, nxt in zip(self._own, self._bridge, self._levels[1:] + [None]):
+            result.append(own[p])
+            if nxt is None:
+                break
+            # c promoted elements are < key, so the position on the next level is 2c
+            # or 2c + 1
+            p = 2 * bridge[p]
+            if p < len(nxt) and nxt[p] < key:
+                p += 1
+        return result
+
+    def find(self, key: Any) -> list[int]:
+        """Return the index of the first occurrence of key in every list, or -1.
+
+        Args:
+            key (Any): Key to be searched for.
+
+        Returns:
+            (list[int]): Index of key in each list, -1 for lists without key.
+        """
+        return [
+            idx if idx < len(values) and values[idx] == key else -1
+            for idx, values in zip(self.search(key), self._lists)
+        ]
+
+
+if __name__ == "__main__":
+    import random
+
+    from binarySearch import binary_search
+    from searchBenchmark import time_lookups
+
+    lists = [[2, 4, 7, 9], [1, 4, 5], [3, 6, 8, 9, 12], []]
+    cascade = FractionalCascading(lists)
+    print(cascade.search(5))
+    print(cascade.find(9))
+
+    k, n = 32, 100_000
+    lists = [sorted(random.randrange(10 * n) for _ in range(n)) for _ in range(k)]
+    keys = [random.randrange(10 * n) for _ in range(20_000)]
+    cascade = FractionalCascading(lists)
+
+    def naive(key: int) -> list[int]:
+        return [binary_search(values, key) for values in lists]
+
+    print(f"\n{k} lists of {n:,} keys")
+    print(f"binary_search per list: {time_lookups(naive, keys):,.0f} queries/s")
+    print(f"FractionalCascading:    {time_lookups(cascade.find, keys):,.0f} queries/s")
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # [2, 2, 1, 0]
+    # [3, -1, 3, -1]
+
+    # timings depend on the machine
+
+    ###########################################################################
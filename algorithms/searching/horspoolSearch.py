@@ -0,0 +1,118 @@
+from typing import Iterable, Iterator
+
+
+class HorspoolSearcher:
+    """Boyer-Moore-Horspool substring searcher.
+
+    The bad-character shift table of the pattern is computed once and reused for
+    every haystack. Each window is compared from its last symbol, and on a mismatch
+    the window skips ahead by the shift of that symbol, often the whole pattern
+    length. Chunked streams are searched by carrying fewer than m symbols from one
+    chunk to the next.
+
+    Works over str (with a str pattern) and bytes-like data (with a bytes pattern).
+    """
+
+    __slots__ = ("_pattern", "_shift", "_default")
+
+    def __init__(self, pattern: str | bytes) -> None:
+        """Precompute the shift table of the pattern.
+
+        Time complexity: O(m)
+
+        Args:
+            pattern (str | bytes): Non-empty pattern to be searched for.
+        """
+        m = len(pattern)
+        if m == 0:
+            raise ValueError("pattern must not be empty")
+        self._pattern = pattern
+        self._default = m
+        # distance from the last occurrence of a symbol (ignoring the last position)
+        # to the end of the pattern; symbols not in the pattern shift by m
+        if isinstance(pattern, bytes):
+            self._shift: list[int] | dict[str, int] = [m] * 256
+        else:
+            self._shift = {}
+        for i in range(m - 1):
+            self._shift[pattern[i]] = m - 1 - i
+
+    def __len__(self) -> int:
+        """Return the length of the pattern."""
+        return len(self._pattern)
+
+    def _scan(self, haystack: str | bytes, start: int) -> Iterator[int]:
+        """Generate occurrences at or after start; the generator returns the first
+        window start that wasn't checked."""
+        pattern, m = self._pattern, len(self._pattern)
+        last = pattern[-1]
+        shift = self._shift
+        default = self._default
+        is_table = isinstance(shift, list)
+        i = start
+        end = len(haystack) - m
+        while i <= end:
+            symbol = haystack[i + m - 1]
+            if symbol == last and haystack[i : i + m - 1] == pattern[:-1]:
+                yield i
+            i += shift[symbol] if is_table else shift.get(symbol, default)
+        return i
+
+    def finditer_chunks(self, chunks: Iterable[str | bytes]) -> Iterator[int]:
+        """Generate the start offset of every occurrence in a stream of chunks.
+
+        Occurrences spanning chunk boundaries are found, overlapping occurrences are
+        all reported, and offsets are counted from the start of the stream. At most
+        m - 1 symbols are carried over between chunks.
+
+        Args:
+            chunks (Iterable[str | bytes]): Consecutive pieces of the haystack, e.g.
+                iter(functools.partial(file.read, 1 << 16), b"").
+
+        Returns:
+            (Iterator[int]): Offsets of the occurrences in increasing order.
+        """
+        carry = self._pattern[:0]
+        base = 0  # stream offset of carry[0]
+        for chunk in chunks:
+            if not isinstance(chunk, (str, bytes)):
+                chunk = bytes(chunk)
+            window = carry + chunk if carry else chunk
+            scan = self._scan(window, 0)
+            while True:
+                try:
+                    found = next(scan)
+                except StopIteration as stop:
+                    resume = stop.value
+                    break
+                yield base + found
+            carry = window[resume:]
+            base += resume
+
+    def finditer(self, haystack: str | bytes) -> Iterator[int]:
+        """Generate the start index of every occurrence of the pattern in haystack."""
+        return self._scan(haystack, 0)
+
+    def find(self, haystack: str | bytes) -> int:
+        """Return the index of the first occurrence of the pattern, otherwise -1."""
+        return next(self._scan(haystack, 0), -1)
+
+
+if __name__ == "__main__":
+    searcher = HorspoolSearcher("abab")
+    print(searcher.find("xxababab"))
+    print(list(searcher.finditer("xxababab")))
+    print(list(searcher.finditer_chunks(["xxa", "b", "ab", "ab"])))
+
+    byte_searcher = HorspoolSearcher(b"needle")
+    print(list(byte_searcher.finditer_chunks([b"hay nee", b"dle hay ", b"needle"])))
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 2
+    # [2, 4]
+    # [2, 4]
+    # [4, 15]
+
+    ###########################################################################
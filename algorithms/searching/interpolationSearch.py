@@ -0,0 +1,81 @@
+from typing import Sequence
+
+
+def interpolation_search(
+    array: Sequence[int | float],
+    key: int | float,
+    low: int = 0,
+    high: int | None = None,
+) -> int:
+    """Interpolation searching.
+
+    Estimates the position of key from the values at both ends of the range, assuming
+    the keys are uniformly distributed, and narrows the range around the estimate.
+    When an estimate fails to halve the range (skewed data), a bisection step is taken
+    too, so the search never needs more than about 2 * log(n) probes.
+
+    With duplicates, the index of the first occurrence is returned, same as binary_search.
+
+    Note: Array need to be sorted and to hold numbers.
+
+    Time complexity: O(log(log(n))) expected on uniform keys, O(log(n)) worst case.
+
+    Args:
+        array (Sequence[int | float]): The sorted sequence of numbers to be searched.
+        key (int | float): Number to be search for in the sequence.
+        low (int): Lower (start) index of the sequence.
+        high (int | None): Higher (end) index of the sequence, len(array) - 1 by default.
+
+    Returns:
+        (int): Index of the key element if present in the sequence, otherwise -1.
+    """
+    if high is None:
+        high = len(array) - 1
+    end = high + 1
+    lo, hi = low, end  # the first index with array[idx] >= key is in [lo, hi]
+    while lo < hi:
+        first, last = array[lo], array[hi - 1]
+        if not first < key:
+            hi = lo
+            break
+        if last < key:
+            lo = hi
+            break
+        size = hi - lo
+        # first < key <= last, so the estimate lies in [lo, hi - 1]
+        pos = lo + int((key - first) * (hi - 1 - lo) / (last - first))
+        if array[pos] < key:
+            lo = pos + 1
+        else:
+            hi = pos
+        if hi - lo > size // 2 and lo < hi:
+            mid = (lo + hi) // 2
+            if array[mid] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+    if lo < end and array[lo] == key:
+        return lo
+    return -1
+
+
+if __name__ == "__main__":
+    arr = [1, 3, 5, 7, 9, 11, 13, 15]
+    print(interpolation_search(arr, 9))
+    print(interpolation_search(arr, 1))
+    print(interpolation_search(arr, 15))
+    print(interpolation_search(arr, 19))
+
+    skewed = [2**i for i in range(60)]
+    print(interpolation_search(skewed, 2**40))
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 4
+    # 0
+    # 7
+    # -1
+    # 40
+
+    ###########################################################################
@@ -0,0 +1,99 @@
+from array import array
+from typing import Iterable, Iterator
+
+
+class KMPSearcher:
+    """Knuth-Morris-Pratt substring searcher.
+
+    The failure table of the pattern is computed once and reused for every haystack.
+    The haystack is read strictly left to right, one symbol at a time, so chunked
+    streams are searched with memory bounded by the pattern, whatever the chunk
+    boundaries.
+
+    Works over str (with a str pattern) and bytes-like data (with a bytes pattern).
+    """
+
+    __slots__ = ("_pattern", "_fail")
+
+    def __init__(self, pattern: str | bytes) -> None:
+        """Precompute the failure table of the pattern.
+
+        Time complexity: O(m)
+
+        Args:
+            pattern (str | bytes): Non-empty pattern to be searched for.
+        """
+        if len(pattern) == 0:
+            raise ValueError("pattern must not be empty")
+        self._pattern = pattern
+        # fail[j]: length of the longest proper border of pattern[:j + 1]
+        fail = array("l", [0]) * len(pattern)
+        k = 0
+        for j in range(1, len(pattern)):
+            while k > 0 and pattern[j] != pattern[k]:
+                k = fail[k - 1]
+            if pattern[j] == pattern[k]:
+                k += 1
+            fail[j] = k
+        self._fail = fail
+
+    def __len__(self) -> int:
+        """Return the length of the pattern."""
+        return len(self._pattern)
+
+    def finditer_chunks(self, chunks: Iterable[str | bytes]) -> Iterator[int]:
+        """Generate the start offset of every occurrence in a stream of chunks.
+
+        Occurrences spanning chunk boundaries are found, overlapping occurrences are
+        all reported, and offsets are counted from the start of the stream.
+
+        Time complexity: O(n)
+
+        Args:
+            chunks (Iterable[str | bytes]): Consecutive pieces of the haystack, e.g.
+                iter(functools.partial(file.read, 1 << 16), b"").
+
+        Returns:
+            (Iterator[int]): Offsets of the occurrences in increasing order.
+        """
+        pattern, fail, m = self._pattern, self._fail, len(self._pattern)
+        j = 0  # length of the matched prefix of pattern
+        base = 0
+        for chunk in chunks:
+            for i, symbol in enumerate(chunk):
+                while j > 0 and symbol != pattern[j]:
+                    j = fail[j - 1]
+                if symbol == pattern[j]:
+                    j += 1
+                    if j == m:
+                        yield base + i - m + 1
+                        j = fail[j - 1]
+            base += len(chunk)
+
+    def finditer(self, haystack: str | bytes) -> Iterator[int]:
+        """Generate the start index of every occurrence of the pattern in haystack."""
+        return self.finditer_chunks((haystack,))
+
+    def find(self, haystack: str | bytes) -> int:
+        """Return the index of the first occurrence of the pattern, otherwise -1."""
+        return next(self.finditer(haystack), -1)
+
+
+if __name__ == "__main__":
+    searcher = KMPSearcher("abab")
+    print(searcher.find("xxababab"))
+    print(list(searcher.finditer("xxababab")))
+    print(list(searcher.finditer_chunks(["xxa", "b", "ab", "ab"])))
+
+    byte_searcher = KMPSearcher(b"\x00\xff")
+    print(list(byte_searcher.finditer_chunks([b"\x01\x00", b"\xff\x00", b"\xff"])))
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 2
+    # [2, 4]
+    # [2, 4]
+    # [1, 3]
+
+    ###########################################################################
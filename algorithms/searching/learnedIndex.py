@@ -0,0 +1,173 @@
+import sys
+from array import array
+from typing import Any, Sequence
+
+from binarySearch import lower_bound, upper_bound
+
+
+def _compact(values: list) -> Any:
+    """Store numbers in an array.array when they fit, otherwise keep the list."""
+    for typecode in ("q", "d"):
+        try:
+            packed = array(typecode, values)
+        except (TypeError, OverflowError):
+            continue
+        if typecode == "q" or all(isinstance(v, float) for v in values):
+            return packed
+    return values
+
+
+class LearnedIndex:
+    """Piecewise-linear learned index over a sorted array of numbers.
+
+    The position of a key is predicted by a linear model of the segment it falls in,
+    and the array is searched only in a window of max_error positions around the
+    prediction. Segments are fitted greedily (shrinking cone), so every distinct key
+    is predicted within max_error of its first position. If the window doesn't hold
+    the answer (a missing key next to a long run of duplicates), the whole array is
+    bisected instead, so results always match lower_bound.
+
+    The sorted array is referenced, not copied, and must not change after building.
+    """
+
+    __slots__ = ("_array", "_max_error", "_seg_keys", "_seg_pos", "_slopes")
+
+    def __init__(self, sorted_array: Sequence[int | float], max_error: int = 32) -> None:
+        """Fit the segments of the model.
+
+        Args:
+            sorted_array (Sequence[int | float]): Numbers sorted in increasing order.
+            max_error (int): Largest distance between a predicted and a true position.
+        """
+        if max_error < 0:
+            raise ValueError("max_error must be non-negative")
+        self._array = sorted_array
+        self._max_error = max_error
+        seg_keys: list = []
+        seg_pos: list[int] = []
+        slopes: list[float] = []
+
+        slope_lo = slope_hi = 0.0
+        x0 = y0 = None
+        prev = None
+        for y, x in enumerate(sorted_array):
+            if x == prev:
+                continue  # only the first position of duplicate keys is modelled
+            prev = x
+            if x0 is None:
+                x0, y0 = x, y
+                slope_lo, slope_hi = 0.0, float("inf")
+                continue
+            dx = x - x0
+            lo = max(slope_lo, (y - max_error - y0) / dx)
+            hi = min(slope_hi, (y + max_error - y0) / dx)
+            if lo <= hi:
+                slope_lo, slope_hi = lo, hi
+                continue
+            seg_keys.append(x0)
+            seg_pos.append(y0)
+            slopes.append(self._pick_slope(slope_lo, slope_hi))
+            x0, y0 = x, y
+            slope_lo, slope_hi = 0.0, float("inf")
+        if x0 is not None:
+            seg_keys.append(x0)
+            seg_pos.append(y0)
+            slopes.append(self._pick_slope(slope_lo, slope_hi))
+
+        self._seg_keys = _compact(seg_keys)
+        self._seg_pos = array("q", seg_pos)
+        self._slopes = array("d", slopes)
+
+    @staticmethod
+    def _pick_slope(low: float, high: float) -> float:
+        """Return a slope inside the feasible range [low, high] of a segment."""
+        if high == float("inf"):
+            return low  # segment of a single key
+        return (low + high) / 2
+
+    def __len__(self) -> int:
+        """Return the number of indexed values."""
+        return len(self._array)
+
+    def segments(self) -> int:
+        """Return the number of linear segments of the model."""
+        return len(self._slopes)
+
+    def nbytes(self) -> int:
+        """Return the memory footprint of the model in bytes, excluding the array."""
+        return (
+            sys.getsizeof(self._seg_keys)
+            + sys.getsizeof(self._seg_pos)
+            + sys.getsizeof(self._slopes)
+        )
+
+    def predict(self, key: int | float) -> int:
+        """Return the predicted position of key in the sorted array."""
+        s = upper_bound(self._seg_keys, key) - 1
+        if s < 0:
+            return 0
+        return self._seg_pos[s] + round(self._slopes[s] * (key - self._seg_keys[s]))
+
+    def lower_bound(self, key: int | float) -> int:
+        """Return the leftmost insertion point for key in the sorted array."""
+        array_, n, eps = self._array, len(self._array), self._max_error
+        s = upper_bound(self._seg_keys, key) - 1
+        if s < 0:
+            pred = 0
+        else:
+            pred = self._seg_pos[s] + round(self._slopes[s] * (key - self._seg_keys[s]))
+        low = min(max(pred - eps, 0), n)
+        high = max(min(pred + eps + 1, n), low)
+        idx = lower_bound(array_, key, low, high)
+        # idx is the answer only if nothing outside the window could be
+        if (idx > low or low == 0 or array_[low - 1] < key) and (
+            idx < high or high == n or not array_[high] < key
+        ):
+            return idx
+        return lower_bound(array_, key)
+
+    def lookup(self, key: int | float) -> int:
+        """Return the index of the first element equal to key, otherwise -1."""
+        idx = self.lower_bound(key)
+        if idx < len(self._array) and self._array[idx] == key:
+            return idx
+        return -1
+
+
+if __name__ == "__main__":
+    import random
+
+    from searchBenchmark import time_lookups
+    from binarySearch import binary_search
+
+    ids = [1, 2, 3, 5, 8, 9, 10, 11, 40, 41, 42]
+    index = LearnedIndex(ids, max_error=1)
+    print(f"segments: {index.segments()}")
+    print([index.lookup(key) for key in (1, 8, 42, 7, 100)])
+
+    # monotone IDs with a few gaps
+    n = 1_000_000
+    ids, next_id = [], 0
+    for _ in range(n):
+        next_id += 1 if random.random() < 0.999 else random.randrange(1_000)
+        ids.append(next_id)
+    keys = [random.randrange(next_id) for _ in range(100_000)]
+    rate = time_lookups(lambda key: binary_search(ids, key), keys)
+    print(f"\nbinary_search: {rate:,.0f} lookups/s")
+    for max_error in (8, 64):
+        index = LearnedIndex(ids, max_error)
+        print(
+            f"LearnedIndex(max_error={max_error}): "
+            f"{time_lookups(index.lookup, keys):,.0f} lookups/s, "
+            f"{index.segments()} segments, {index.nbytes():,} bytes"
+        )
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # segments: 2
+    # [0, 4, 10, -1, -1]
+
+    # timings and segment counts depend on the random data
+
+    ###########################################################################
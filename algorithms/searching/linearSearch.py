@@ -1,7 +1,28 @@
-from typing import TypeVar, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Value, shared_memory
+from typing import TypeVar, List, Any, Sequence, Iterator
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, numpy arrays are then never passed in
+    np = None
 
 T = TypeVar("T")
 
+# formats of buffers that are shared with worker processes instead of pickled
+_SHAREABLE_FORMATS = "bBhHiIlLqQnNfd"
+
+# integer formats whose items compare equal exactly when their bytes are equal
+_INTEGER_FORMATS = "bBhHiIlLqQnN"
+
+# number of bytes copied out of a memoryview per bytes.find pass
+_FIND_CHUNK = 1 << 20
+
+# shared lowest matching index, set in every worker process by _init_worker
+_best: Any = None
+
 
 def linear_search(array: List[T], key: T) -> int:
     """Search sequentially whole array against key.
@@ -18,6 +39,9 @@ def linear_search(array: List[T], key: T) -> int:
     Returns:
         int: Index of element if it's present in the list, otherwise -1.
     """
+    matches = _buffer_matches(array, key)
+    if matches is not None:
+        return next(matches, -1)
     index = -1
     for i in range(len(array)):
         if key == array[i]:
@@ -26,7 +50,231 @@ def linear_search(array: List[T], key: T) -> int:
     return index
 
 
+def linear_search_all(array: Sequence[T], key: T) -> Any:
+    """Search sequentially whole array for every index of key.
+
+    Numpy arrays are compared in one vectorized pass and an index array is returned.
+    For bytes, bytearray and integer buffers (array.array, memoryview) the encoded key
+    is located with bytes.find, so no Python object is created per element. Other
+    sequences are compared element by element. Except for numpy arrays, the indices are
+    generated lazily in increasing order.
+
+    Note: List need not to be sorted.
+
+    Time complexity: O(n)
+
+    Args:
+        array (Sequence[T]): The sequence to be searched.
+        key (T): Element to search for in the sequence.
+
+    Returns:
+        Any: Numpy array of indices for numpy input, otherwise an iterator of indices.
+    """
+    if np is not None and isinstance(array, np.ndarray):
+        return np.flatnonzero(array == key)
+    matches = _buffer_matches(array, key)
+    if matches is not None:
+        return matches
+    return (i for i, item in enumerate(array) if key == item)
+
+
+def _buffer_matches(array: Any, key: Any) -> Iterator[int] | None:
+    """Return an iterator of indices of key in an integer buffer.
+
+    Returns None if array isn't a one-dimensional integer buffer or key isn't an
+    integral number, in which case elements have to be compared one by one.
+    """
+    if isinstance(key, float) and key.is_integer():
+        key = int(key)
+    if not isinstance(key, int):
+        return None
+    if isinstance(array, (bytes, bytearray)):
+        if not 0 <= key <= 255:
+            return iter(())
+        return _find_all(array, bytes((key,)), 1)
+    if np is not None and isinstance(array, np.ndarray):
+        return None
+    try:
+        view = memoryview(array)
+    except TypeError:
+        return None
+    if view.ndim != 1 or not view.c_contiguous or view.format not in _INTEGER_FORMATS:
+        return None
+    try:
+        needle = struct.pack(view.format, key)
+    except struct.error:
+        return iter(())  # key out of range, no element can be equal
+    return _find_all(view.cast("B"), needle, view.itemsize)
+
+
+def _find_all(raw: Any, needle: bytes, itemsize: int) -> Iterator[int]:
+    """Generate item indices where needle occurs at an item boundary of raw bytes."""
+    if isinstance(raw, memoryview):
+        step = _FIND_CHUNK - _FIND_CHUNK % itemsize
+        chunks = (
+            (base, bytes(raw[base : base + step])) for base in range(0, len(raw), step)
+        )
+    else:
+        chunks = iter(((0, raw),))
+    for base, chunk in chunks:
+        pos = chunk.find(needle)
+        while pos != -1:
+            misaligned = pos % itemsize
+            if misaligned == 0:
+                yield (base + pos) // itemsize
+                pos = chunk.find(needle, pos + itemsize)
+            else:
+                pos = chunk.find(needle, pos - misaligned + itemsize)
+
+
+def linear_search_parallel(
+    array: Sequence[T],
+    key: T,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    block_size: int = 65_536,
+) -> int:
+    """Search the array in chunks across a pool of worker processes.
+
+    Numeric buffers (array.array, memoryview, numpy arrays, ...) are copied once into
+    shared memory, other sequences are sent to the workers chunk by chunk. Workers scan
+    their chunk block by block and publish matches in a shared lowest matching index.
+    A worker stops as soon as a match before its chunk is known, and chunks after a
+    match are cancelled if they haven't started yet, so the result is the lowest
+    matching index, same as linear_search.
+
+    Note: Call it from code guarded by `if __name__ == "__main__"`, since worker
+    processes may import the calling module.
+
+    Time complexity: O(n / workers)
+
+    Args:
+        array (Sequence[T]): The sequence to be searched.
+        key (T): Element to search for in the sequence.
+        workers (int | None): Number of worker processes, os.cpu_count() by default.
+        chunk_size (int | None): Number of elements per task, by default the array is
+            split into 4 chunks per worker.
+        block_size (int): Number of elements scanned between two cancellation checks.
+
+    Returns:
+        int: Index of element if it's present in the sequence, otherwise -1.
+    """
+    n = len(array)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or n <= block_size:
+        return linear_search(array, key)
+    if chunk_size is None:
+        chunk_size = -(-n // (4 * workers))
+    chunk_size = max(chunk_size, block_size)
+
+    best = Value("q", n)
+    shm = None
+    fmt = None
+    view = _shareable_view(array)
+    if view is not None:
+        fmt = view.format
+        shm = shared_memory.SharedMemory(create=True, size=max(view.nbytes, 1))
+        shm.buf[: view.nbytes] = view.cast("B")
+        view.release()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(best,)
+        ) as executor:
+            futures = {}
+            for start in range(0, n, chunk_size):
+                stop = min(start + chunk_size, n)
+                chunk = None if shm is not None else array[start:stop]
+                name = shm.name if shm is not None else None
+                future = executor.submit(
+                    _search_chunk, start, stop, chunk, name, fmt, key, block_size
+                )
+                futures[future] = start
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                found = future.result()
+                if found >= 0:
+                    # chunks after the match can't improve on it
+                    for other, start in futures.items():
+                        if start > found:
+                            other.cancel()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+    return best.value if best.value < n else -1
+
+
+def _shareable_view(array: Any) -> memoryview | None:
+    """Return a flat memoryview of array if it's a numeric buffer, otherwise None."""
+    try:
+        view = memoryview(array)
+    except TypeError:
+        return None
+    if view.ndim != 1 or not view.c_contiguous or view.format not in _SHAREABLE_FORMATS:
+        view.release()
+        return None
+    return view
+
+
+def _init_worker(best: Any) -> None:
+    """Store the shared lowest matching index in the worker process."""
+    global _best
+    _best = best
+
+
+def _search_chunk(
+    start: int,
+    stop: int,
+    chunk: Sequence | None,
+    shm_name: str | None,
+    fmt: str | None,
+    key: Any,
+    block_size: int,
+) -> int:
+    """Search array[start:stop] in a worker, return the matching index or -1."""
+    shm = None
+    if chunk is None:
+        shm = shared_memory.SharedMemory(name=shm_name)
+        data = shm.buf.cast(fmt)
+    else:
+        data = chunk
+    offset = 0 if chunk is None else start
+    try:
+        for block_start in range(start, stop, block_size):
+            if _best.value < start:
+                return -1  # a match before this chunk was already found
+            block_stop = min(block_start + block_size, stop)
+            block = data[block_start - offset : block_stop - offset]
+            if isinstance(block, memoryview):
+                block = block.tolist()
+            elif not isinstance(block, list):
+                block = list(block)
+            try:
+                found = block_start + block.index(key)
+            except ValueError:
+                continue
+            with _best.get_lock():
+                if found < _best.value:
+                    _best.value = found
+            return found
+        return -1
+    finally:
+        if shm is not None:
+            data.release()
+            shm.close()
+
+
 if __name__ == "__main__":
     arr: List[int] = [23, 45, 67, 89, 101, 123]
     print(linear_search(arr, 123))  # Output: 5
     print(linear_search(arr, 99))  # Output: -1
+
+    print(list(linear_search_all([3, 1, 3, 2, 3], 3)))  # Output: [0, 2, 4]
+    print(list(linear_search_all(b"banana", ord("a"))))  # Output: [1, 3, 5]
+
+    from array import array
+
+    big = array("q", range(2_000_000))
+    print(linear_search_parallel(big, 1_500_000, workers=4))  # Output: 1500000
+    print(linear_search_parallel(big, -1, workers=4))  # Output: -1
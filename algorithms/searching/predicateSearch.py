@@ -0,0 +1,92 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable
+
+
+def search_predicate(
+    lo: int,
+    hi: int,
+    pred: Callable[[int], bool],
+    fanout: int = 1,
+    executor: Executor | None = None,
+) -> int:
+    """Return the first integer x in [lo, hi) for which pred(x) is true.
+
+    pred must be monotone over the range: false up to some point and true from there
+    on. Every round evaluates fanout probes concurrently, splitting the range into
+    fanout + 1 parts, so only about log_(fanout + 1)(hi - lo) rounds are needed
+    instead of log_2(hi - lo). The boundary semantics are the same as lower_bound:
+    if pred is false everywhere, hi is returned.
+
+    Time complexity: O(log(n) / log(fanout + 1)) rounds of fanout calls to pred.
+
+    Args:
+        lo (int): Lower (start) bound of the range.
+        hi (int): Upper (exclusive) bound of the range.
+        pred (Callable[[int], bool]): Monotone predicate, expensive to evaluate.
+        fanout (int): Number of probes evaluated concurrently per round.
+        executor (Executor | None): Executor to evaluate probes in, e.g. a
+            ProcessPoolExecutor for CPU-bound predicates (pred must then be picklable).
+            A thread pool of fanout threads is used by default.
+
+    Returns:
+        (int): The first x with pred(x) true, or hi if there's none.
+    """
+    if fanout < 1:
+        raise ValueError("fanout must be at least 1")
+    if fanout == 1:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if pred(mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=fanout)
+    try:
+        # the answer is always in [lo, hi]
+        while lo < hi:
+            size = hi - lo
+            if size <= fanout:
+                probes = list(range(lo, hi))
+            else:
+                probes = [lo + j * size // (fanout + 1) for j in range(1, fanout + 1)]
+            results = list(executor.map(pred, probes))
+            for probe, result in zip(probes, results):
+                if result:
+                    hi = probe
+                    break
+                lo = probe + 1
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return lo
+
+
+if __name__ == "__main__":
+    import time
+
+    def replayed_past(offset: int) -> bool:
+        """Pretend to replay a log up to offset and check for the bad record."""
+        time.sleep(0.01)
+        return offset >= 734_521
+
+    for fanout in (1, 3, 7):
+        start = time.perf_counter()
+        first_bad = search_predicate(0, 1_000_000, replayed_past, fanout=fanout)
+        elapsed = time.perf_counter() - start
+        print(f"fanout={fanout}: {first_bad} in {elapsed:.2f} s")
+
+    print(search_predicate(0, 10, lambda x: False, fanout=4))
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # fanout=1: 734521 in 0.20 s
+    # fanout=3: 734521 in 0.10 s
+    # fanout=7: 734521 in 0.07 s
+    # 10
+
+    ###########################################################################
@@ -0,0 +1,169 @@
+import mmap
+import os
+import struct
+from typing import Any, Callable, Iterator, Sequence
+
+from binarySearch import lower_bound, upper_bound
+
+
+def _first_field(record: tuple) -> Any:
+    """Default key extractor, the first field of the record."""
+    return record[0]
+
+
+class _RecordKeys(Sequence):
+    """Read-only sequence of keys, decoding one record per access."""
+
+    __slots__ = ("_buffer", "_struct", "_start", "_len", "_key")
+
+    def __init__(
+        self,
+        buffer: Any,
+        record_struct: struct.Struct,
+        start: int,
+        length: int,
+        key: Callable[[tuple], Any],
+    ) -> None:
+        self._buffer = buffer
+        self._struct = record_struct
+        self._start = start
+        self._len = length
+        self._key = key
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> Any:
+        record = self._struct.unpack_from(
+            self._buffer, self._start + idx * self._struct.size
+        )
+        return self._key(record)
+
+
+class RecordFileSearcher:
+    """Binary search over a file of fixed-width records sorted by key.
+
+    The file is memory-mapped and only the records probed by the search are decoded
+    with struct, so a lookup touches O(log(n)) pages and the file is never loaded.
+    Results are byte offsets of records in the file.
+    """
+
+    __slots__ = ("_file", "_mmap", "_struct", "_header_size", "_keys")
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        record_format: str,
+        key: Callable[[tuple], Any] = _first_field,
+        header_size: int = 0,
+    ) -> None:
+        """Open and map the record file.
+
+        Args:
+            path (str | os.PathLike): Path of the record file.
+            record_format (str): struct format of a record, e.g. "<q16s".
+            key (Callable[[tuple], Any]): Extracts the sort key from an unpacked record.
+            header_size (int): Number of bytes before the first record.
+
+        Raises:
+            ValueError: If the records don't fill the file exactly.
+        """
+        self._struct = struct.Struct(record_format)
+        self._header_size = header_size
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        body = size - header_size
+        if body < 0 or body % self._struct.size != 0:
+            self._file.close()
+            raise ValueError(
+                f"file size {size} doesn't fit records of {self._struct.size} bytes"
+            )
+        if size == 0:
+            self._mmap = b""  # empty files can't be mapped
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mmap, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+                self._mmap.madvise(mmap.MADV_RANDOM)
+        self._keys = _RecordKeys(
+            self._mmap, self._struct, header_size, body // self._struct.size, key
+        )
+
+    def __len__(self) -> int:
+        """Return the number of records in the file."""
+        return len(self._keys)
+
+    def __enter__(self) -> "RecordFileSearcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap and close the record file."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def _offset(self, idx: int) -> int:
+        """Return the byte offset of the record at index idx."""
+        return self._header_size + idx * self._struct.size
+
+    def record_at(self, offset: int) -> tuple:
+        """Return the unpacked record at the given byte offset."""
+        return self._struct.unpack_from(self._mmap, offset)
+
+    def lower_bound(self, key: Any) -> int:
+        """Return the offset of the first record with key not less than the given key.
+        Returns the offset just past the last record if there's none.
+        """
+        return self._offset(lower_bound(self._keys, key))
+
+    def upper_bound(self, key: Any) -> int:
+        """Return the offset of the first record with key greater than the given key.
+        Returns the offset just past the last record if there's none.
+        """
+        return self._offset(upper_bound(self._keys, key))
+
+    def find(self, key: Any) -> int:
+        """Return the offset of the first record with the given key, otherwise -1."""
+        idx = lower_bound(self._keys, key)
+        if idx < len(self._keys) and self._keys[idx] == key:
+            return self._offset(idx)
+        return -1
+
+    def find_range(self, start: Any = None, stop: Any = None) -> Iterator[int]:
+        """Return an iterator over offsets of records with keys in the range [start, stop).
+        The end point is exclusive; keys equal to stop are not included in the iteration.
+        """
+        first = 0 if start is None else lower_bound(self._keys, start)
+        last = len(self._keys) if stop is None else lower_bound(self._keys, stop, first)
+        for idx in range(first, last):
+            yield self._offset(idx)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    record = struct.Struct("<q8s")
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        for key, name in [(2, b"two"), (7, b"seven"), (7, b"SEVEN"), (10, b"ten")]:
+            tmp.write(record.pack(key, name))
+
+    with RecordFileSearcher(tmp.name, "<q8s") as searcher:
+        print(f"records: {len(searcher)}")
+        print(f"offset of key 7: {searcher.find(7)}")
+        print(f"offset of key 8: {searcher.find(8)}")
+        print(f"record at 16: {searcher.record_at(16)}")
+        print(f"offsets in [5, 10): {list(searcher.find_range(5, 10))}")
+    os.remove(tmp.name)
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # records: 4
+    # offset of key 7: 16
+    # offset of key 8: -1
+    # record at 16: (7, b'seven\x00\x00\x00')
+    # offsets in [5, 10): [16, 32]
+
+    ###########################################################################
@@ -0,0 +1,250 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Sequence, Any
+
+from linearSearch import linear_search
+from binarySearch import binary_search, binary_search_recursive, lower_bound
+from exponentialSearch import exponential_search
+from eytzingerSearch import StaticSearchIndex
+from interpolationSearch import interpolation_search
+from learnedIndex import LearnedIndex
+
+Lookup = Callable[[Any], int]
+Strategy = Callable[[Sequence], Lookup]
+Generator = Callable[[random.Random, int, int], tuple[list, list]]
+
+
+def _linear_search_strategy(array: Sequence) -> Lookup:
+    return lambda key: linear_search(array, key)
+
+
+def _recursive_strategy(array: Sequence) -> Lookup:
+    high = len(array) - 1
+    return lambda key: binary_search_recursive(array, key, 0, high)
+
+
+def _binary_search_strategy(array: Sequence) -> Lookup:
+    return lambda key: binary_search(array, key)
+
+
+def _lower_bound_strategy(array: Sequence) -> Lookup:
+    return lambda key: lower_bound(array, key)
+
+
+def _exponential_search_strategy(array: Sequence) -> Lookup:
+    return lambda key: exponential_search(array, key)
+
+
+def _interpolation_search_strategy(array: Sequence) -> Lookup:
+    return lambda key: interpolation_search(array, key)
+
+
+def _eytzinger_strategy(array: Sequence) -> Lookup:
+    return StaticSearchIndex(array).lookup
+
+
+def _learned_index_strategy(array: Sequence) -> Lookup:
+    return LearnedIndex(array).lookup
+
+
+# name -> strategy; a strategy prepares the sorted array once and returns a lookup
+STRATEGIES: dict[str, Strategy] = {
+    "linear_search": _linear_search_strategy,
+    "binary_search_recursive": _recursive_strategy,
+    "binary_search": _binary_search_strategy,
+    "lower_bound": _lower_bound_strategy,
+    "exponential_search": _exponential_search_strategy,
+    "interpolation_search": _interpolation_search_strategy,
+    "eytzinger": _eytzinger_strategy,
+    "learned_index": _learned_index_strategy,
+}
+
+
+# largest array size a strategy is run on, strategies not listed run on all sizes
+SIZE_LIMITS: dict[str, int] = {
+    "linear_search": 10**4,
+}
+
+
+def _mixed_keys(rng: random.Random, array: list, lookups: int, high: int) -> list:
+    """Return keys of which about half are present in array."""
+    return [
+        rng.choice(array) if rng.random() < 0.5 else rng.randrange(high)
+        for _ in range(lookups)
+    ]
+
+
+def uniform_input(rng: random.Random, n: int, lookups: int) -> tuple[list, list]:
+    """Uniformly distributed keys, half of the lookups are hits."""
+    array = sorted(rng.randrange(4 * n) for _ in range(n))
+    return array, _mixed_keys(rng, array, lookups, 4 * n)
+
+
+def skewed_input(rng: random.Random, n: int, lookups: int) -> tuple[list, list]:
+    """Heavy-tailed (Pareto) keys, half of the lookups are hits."""
+    array = sorted(int(rng.paretovariate(1.1) * n) for _ in range(n))
+    return array, _mixed_keys(rng, array, lookups, array[-1] + 1)
+
+
+def duplicates_input(rng: random.Random, n: int, lookups: int) -> tuple[list, list]:
+    """About 1000 copies of every key, half of the lookups are hits."""
+    distinct = max(1, n // 1000)
+    array = sorted(2 * rng.randrange(distinct) for _ in range(n))
+    return array, _mixed_keys(rng, array, lookups, 2 * distinct)
+
+
+def adversarial_input(rng: random.Random, n: int, lookups: int) -> tuple[list, list]:
+    """Even keys followed by one huge outlier, every lookup is a miss.
+
+    The outlier defeats interpolation and misses make linear scans read everything.
+    """
+    array = [2 * i for i in range(n - 1)] + [n**4]
+    keys = [2 * rng.randrange(n) + 1 for _ in range(lookups)]
+    return array, keys
+
+
+GENERATORS: dict[str, Generator] = {
+    "uniform": uniform_input,
+    "skewed": skewed_input,
+    "duplicates": duplicates_input,
+    "adversarial": adversarial_input,
+}
+
+
+def time_lookups(lookup: Lookup, keys: Sequence) -> float:
+    """Return the number of lookups per second for all keys.
+
+    Args:
+        lookup (Lookup): Function that searches a single key.
+        keys (Sequence): Keys to be searched for.
+
+    Returns:
+        (float): Lookups per second.
+    """
+    start = time.perf_counter()
+    for key in keys:
+        lookup(key)
+    elapsed = time.perf_counter() - start
+    return len(keys) / elapsed if elapsed > 0 else float("inf")
+
+
+def latencies(lookup: Lookup, keys: Sequence) -> list[int]:
+    """Return the sorted latency of every lookup in nanoseconds.
+
+    Args:
+        lookup (Lookup): Function that searches a single key.
+        keys (Sequence): Keys to be searched for.
+
+    Returns:
+        (list[int]): Latencies in increasing order.
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    for key in keys:
+        start = clock()
+        lookup(key)
+        samples.append(clock() - start)
+    samples.sort()
+    return samples
+
+
+def percentile(samples: Sequence[int], p: float) -> int:
+    """Return the p-th percentile (nearest rank) of sorted samples."""
+    if not samples:
+        return 0
+    rank = max(0, min(len(samples) - 1, int(round(p / 100 * len(samples))) - 1))
+    return samples[rank]
+
+
+def run(
+    strategies: dict[str, Strategy],
+    sizes: Sequence[int],
+    lookups: int,
+    generators: dict[str, Generator] | None = None,
+    seed: int = 0,
+) -> list[dict]:
+    """Benchmark every strategy on every input distribution and size.
+
+    Inputs are generated from the seed, so runs with the same arguments search the
+    same arrays for the same keys.
+
+    Args:
+        strategies (dict[str, Strategy]): Strategies to be benchmarked.
+        sizes (Sequence[int]): Array sizes.
+        lookups (int): Number of keys searched per (strategy, distribution, size).
+        generators (dict[str, Generator] | None): Input distributions, GENERATORS by default.
+        seed (int): Seed of the random input generator.
+
+    Returns:
+        (list[dict]): One result row per (strategy, distribution, size).
+    """
+    if generators is None:
+        generators = GENERATORS
+    results = []
+    for dist, generate in generators.items():
+        for n in sizes:
+            array, keys = generate(random.Random(f"{seed}-{dist}-{n}"), n, lookups)
+            for name, strategy in strategies.items():
+                if n > SIZE_LIMITS.get(name, n):
+                    continue
+                lookup = strategy(array)
+                rate = time_lookups(lookup, keys)
+                samples = latencies(lookup, keys)
+                results.append(
+                    {
+                        "strategy": name,
+                        "distribution": dist,
+                        "size": n,
+                        "lookups": len(keys),
+                        "lookups_per_sec": rate,
+                        "p50_ns": percentile(samples, 50),
+                        "p99_ns": percentile(samples, 99),
+                    }
+                )
+            del array, keys
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark search strategies.")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size, 10^x")
+    parser.add_argument("--max-exp", type=int, default=7, help="largest size, 10^x")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--strategy", action="append", choices=list(STRATEGIES))
+    parser.add_argument("--distribution", action="append", choices=list(GENERATORS))
+    parser.add_argument(
+        "--json", metavar="PATH", help="write results as JSON ('-' for stdout)"
+    )
+    args = parser.parse_args()
+
+    strategies = {name: STRATEGIES[name] for name in args.strategy or STRATEGIES}
+    generators = {name: GENERATORS[name] for name in args.distribution or GENERATORS}
+    sizes = [10**e for e in range(args.min_exp, args.max_exp + 1)]
+    results = run(strategies, sizes, args.lookups, generators, args.seed)
+
+    if args.json:
+        report = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "lookups": args.lookups,
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w") as out:
+                json.dump(report, out, indent=2)
+    else:
+        for row in results:
+            print(
+                f"{row['strategy']:<25} {row['distribution']:<12} n={row['size']:<10} "
+                f"{row['lookups_per_sec']:>12,.0f} lookups/s "
+                f"p50={row['p50_ns']:>7,} ns p99={row['p99_ns']:>8,} ns"
+            )
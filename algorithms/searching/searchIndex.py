@@ -0,0 +1,142 @@
+from typing import Generic, Iterable, List, TypeVar
+
+from binarySearch import lower_bound
+
+T = TypeVar("T")
+
+
+class SearchIndex(Generic[T]):
+    """Hash index from every value of a list to its positions.
+
+    The index is built in one pass on the first lookup and then answers lookups in
+    O(1). Mutations made through append, extend and __setitem__ update the index
+    incrementally. Every mutation increments a version counter and the index
+    remembers the version it was built for; mutations of the list made elsewhere
+    must be announced with invalidate(), after which the next lookup rebuilds the
+    index instead of returning stale positions.
+
+    Note: Values need to be hashable.
+    """
+
+    __slots__ = ("_array", "_positions", "_version", "_indexed_version", "_indexed_len")
+
+    def __init__(self, array: List[T]) -> None:
+        """Create a lazily built index over array (the list is not copied)."""
+        self._array = array
+        self._positions: dict[T, list[int]] = {}
+        self._version = 0
+        self._indexed_version = -1
+        self._indexed_len = 0
+
+    def __len__(self) -> int:
+        """Return the number of elements of the indexed list."""
+        return len(self._array)
+
+    @property
+    def version(self) -> int:
+        """Return the version of the list, incremented by every known mutation."""
+        return self._version
+
+    def invalidate(self) -> None:
+        """Mark the index stale after the list was mutated outside of the index."""
+        self._version += 1
+
+    def _is_current(self) -> bool:
+        """Return True if the index matches the current version of the list."""
+        return (
+            self._indexed_version == self._version
+            and self._indexed_len == len(self._array)
+        )
+
+    def _build(self) -> None:
+        """Rebuild the index in one pass over the list."""
+        positions: dict[T, list[int]] = {}
+        for i, value in enumerate(self._array):
+            bucket = positions.get(value)
+            if bucket is None:
+                positions[value] = [i]
+            else:
+                bucket.append(i)
+        self._positions = positions
+        self._indexed_version = self._version
+        self._indexed_len = len(self._array)
+
+    def _current(self) -> dict[T, list[int]]:
+        """Return the positions of every value, rebuilding them if stale."""
+        if not self._is_current():
+            self._build()
+        return self._positions
+
+    def first(self, key: T) -> int:
+        """Return index of the first element equal to key, otherwise -1.
+
+        Same result as linear_search(array, key).
+
+        Time complexity: O(1)
+        """
+        bucket = self._current().get(key)
+        return bucket[0] if bucket else -1
+
+    def positions(self, key: T) -> list[int]:
+        """Return the indices of all elements equal to key in increasing order.
+
+        Time complexity: O(k) for k matches
+        """
+        return list(self._current().get(key, ()))
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if some element is equal to key."""
+        return key in self._current()
+
+    def append(self, value: T) -> None:
+        """Append value to the list and index it."""
+        current = self._is_current()
+        self._array.append(value)
+        self._version += 1
+        if current:
+            self._positions.setdefault(value, []).append(len(self._array) - 1)
+            self._indexed_version = self._version
+            self._indexed_len = len(self._array)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Append all values to the list and index them."""
+        for value in values:
+            self.append(value)
+
+    def __getitem__(self, idx: int) -> T:
+        """Return the element at index idx of the list."""
+        return self._array[idx]
+
+    def __setitem__(self, idx: int, value: T) -> None:
+        """Replace the element at index idx of the list and update the index."""
+        current = self._is_current()
+        if idx < 0:
+            idx += len(self._array)
+        old = self._array[idx]
+        self._array[idx] = value
+        self._version += 1
+        if not current:
+            return
+        bucket = self._positions[old]
+        del bucket[lower_bound(bucket, idx)]
+        if not bucket:
+            del self._positions[old]
+        bucket = self._positions.setdefault(value, [])
+        bucket.insert(lower_bound(bucket, idx), idx)
+        self._indexed_version = self._version
+
+
+if __name__ == "__main__":
+    arr = [23, 45, 67, 45, 101, 123]
+    index = SearchIndex(arr)
+    print(index.first(45))  # Output: 1
+    print(index.positions(45))  # Output: [1, 3]
+    print(index.first(99))  # Output: -1
+
+    index.append(99)
+    index[1] = 7
+    print(index.first(99), index.positions(45))  # Output: 6 [3]
+
+    arr.insert(0, 5)  # mutated outside of the index
+    index.invalidate()
+    print(index.first(99), index.first(5))  # Output: 7 0
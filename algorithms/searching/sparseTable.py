@@ -0,0 +1,161 @@
+from array import array
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, levels are then built in pure Python
+    np = None
+
+
+class SparseTable:
+    """Sparse table for range minimum / maximum queries over a static array.
+
+    Level j stores, for every start i, the index of the minimum (and of the maximum)
+    of values[i:i + 2^j]. Any range [l, r) is covered by two overlapping blocks of
+    the same level, so a query is answered with two lookups. With numpy, every level
+    is built from the previous one with a single vectorized comparison, and batches
+    of queries are answered without a Python loop.
+
+    Ranges are half-open, [l, r), like slices; ties resolve to the leftmost index.
+    """
+
+    __slots__ = ("_values", "_argmin", "_argmax", "_n")
+
+    def __init__(self, values: Sequence[int | float]) -> None:
+        """Build the min and max levels.
+
+        Time complexity: O(n log(n))
+
+        Args:
+            values (Sequence[int | float]): The static array; it's copied.
+        """
+        n = len(values)
+        self._n = n
+        if np is not None:
+            self._values = np.array(values)
+            levels = max(n, 1).bit_length()
+            self._argmin = np.zeros((levels, n), dtype=np.intp)
+            self._argmax = np.zeros((levels, n), dtype=np.intp)
+            self._argmin[0] = self._argmax[0] = np.arange(n)
+            for j in range(1, levels):
+                half, width = 1 << (j - 1), n - (1 << j) + 1
+                for table, better in (
+                    (self._argmin, np.less),
+                    (self._argmax, np.greater),
+                ):
+                    left = table[j - 1, :width]
+                    right = table[j - 1, half : half + width]
+                    chosen = better(self._values[right], self._values[left])
+                    table[j, :width] = np.where(chosen, right, left)
+        else:
+            self._values = list(values)
+            self._argmin = self._build_levels(self._values, lambda a, b: a < b)
+            self._argmax = self._build_levels(self._values, lambda a, b: a > b)
+
+    @staticmethod
+    def _build_levels(values: list, better: Any) -> list[array]:
+        """Build the levels of indices in pure Python."""
+        n = len(values)
+        levels = [array("q", range(n))]
+        j = 1
+        while (1 << j) <= n:
+            prev, half = levels[-1], 1 << (j - 1)
+            level = array("q")
+            for i in range(n - (1 << j) + 1):
+                left, right = prev[i], prev[i + half]
+                level.append(right if better(values[right], values[left]) else left)
+            levels.append(level)
+            j += 1
+        return levels
+
+    def __len__(self) -> int:
+        """Return the length of the array."""
+        return self._n
+
+    def _query(self, table: Any, l: int, r: int) -> int:
+        """Return the index chosen by table over values[l:r]."""
+        if not 0 <= l < r <= self._n:
+            raise IndexError(f"invalid range [{l}, {r}) of an array of {self._n}")
+        j = (r - l).bit_length() - 1
+        left, right = table[j][l], table[j][r - (1 << j)]
+        if table is self._argmin:
+            return int(right if self._values[right] < self._values[left] else left)
+        return int(right if self._values[right] > self._values[left] else left)
+
+    def argmin(self, l: int, r: int) -> int:
+        """Return the index of the minimum of values[l:r]. Time complexity: O(1)"""
+        return self._query(self._argmin, l, r)
+
+    def argmax(self, l: int, r: int) -> int:
+        """Return the index of the maximum of values[l:r]. Time complexity: O(1)"""
+        return self._query(self._argmax, l, r)
+
+    def min(self, l: int, r: int) -> int | float:
+        """Return the minimum of values[l:r]. Time complexity: O(1)"""
+        return self._values[self.argmin(l, r)]
+
+    def max(self, l: int, r: int) -> int | float:
+        """Return the maximum of values[l:r]. Time complexity: O(1)"""
+        return self._values[self.argmax(l, r)]
+
+    def _query_many(self, table: Any, ls: Any, rs: Any, better: Any) -> Any:
+        """Answer a batch of [l, r) queries with table, vectorized if numpy is available."""
+        if np is None:
+            return array("q", (self._query(table, l, r) for l, r in zip(ls, rs)))
+        ls = np.asarray(ls, dtype=np.intp)
+        rs = np.asarray(rs, dtype=np.intp)
+        if ls.shape != rs.shape:
+            raise ValueError("ls and rs must have the same shape")
+        if np.any((ls < 0) | (ls >= rs) | (rs > self._n)):
+            raise IndexError("invalid range in batch")
+        # exact floor(log2(length)) for lengths below 2^53
+        j = np.frexp(rs - ls)[1] - 1
+        left = table[j, ls]
+        right = table[j, rs - (np.intp(1) << j)]
+        return np.where(better(self._values[right], self._values[left]), right, left)
+
+    def argmin_many(self, ls: Any, rs: Any) -> Any:
+        """Return the index of the minimum of values[l:r] for every pair of ls and rs.
+
+        Args:
+            ls (Any): Start indices of the ranges.
+            rs (Any): Stop (exclusive) indices of the ranges.
+
+        Returns:
+            (Any): numpy array of indices, or an array.array without numpy.
+        """
+        return self._query_many(self._argmin, ls, rs, np.less if np else None)
+
+    def argmax_many(self, ls: Any, rs: Any) -> Any:
+        """Return the index of the maximum of values[l:r] for every pair of ls and rs."""
+        return self._query_many(self._argmax, ls, rs, np.greater if np else None)
+
+    def min_many(self, ls: Any, rs: Any) -> Any:
+        """Return the minimum of values[l:r] for every pair of ls and rs."""
+        idx = self.argmin_many(ls, rs)
+        return self._values[idx] if np is not None else [self._values[i] for i in idx]
+
+    def max_many(self, ls: Any, rs: Any) -> Any:
+        """Return the maximum of values[l:r] for every pair of ls and rs."""
+        idx = self.argmax_many(ls, rs)
+        return self._values[idx] if np is not None else [self._values[i] for i in idx]
+
+
+if __name__ == "__main__":
+    table = SparseTable([5, 2, 8, 1, 9, 3, 7, 1])
+    print(table.min(0, 3), table.argmin(0, 3))
+    print(table.min(2, 8), table.argmin(2, 8))
+    print(table.max(0, 8), table.argmax(5, 7))
+    print([int(v) for v in table.min_many([0, 2, 4], [3, 8, 6])])
+    print([int(i) for i in table.argmax_many([0, 2, 4], [3, 8, 6])])
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # 2 1
+    # 1 3
+    # 9 6
+    # [2, 1, 3]
+    # [2, 4, 4]
+
+    ###########################################################################
@@ -0,0 +1,227 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Any
+
+from binarySearch import lower_bound, upper_bound
+
+# file layout: header, text, padding to 8 bytes, suffix array, LCP array
+_MAGIC = b"SUFARR1" + (b"<" if sys.byteorder == "little" else b">")
+_HEADER = struct.Struct("=8sq")
+
+
+class SuffixArray:
+    """Suffix array with LCP array over a fixed corpus.
+
+    The suffix array lists the start of every suffix of the text in sorted order, so
+    all occurrences of a pattern are one contiguous run of it. The run is found by
+    bisecting over suffixes with lower_bound / upper_bound, comparing only the first
+    m bytes of each probed suffix. lcp[i] is the length of the longest common prefix
+    of the suffixes at ranks i - 1 and i.
+
+    str text is encoded as UTF-8, and positions are byte offsets into the encoding.
+    The index can be saved to disk and memory-mapped back without rebuilding.
+    """
+
+    __slots__ = ("_text", "_text_offset", "_n", "_sa", "_lcp", "_mmap")
+
+    def __init__(self, text: str | bytes) -> None:
+        """Build the suffix array by prefix doubling and the LCP array by Kasai.
+
+        Time complexity: O(n log^2(n))
+
+        Args:
+            text (str | bytes): The corpus to be indexed.
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        self._text = bytes(text)
+        self._text_offset = 0
+        self._n = len(self._text)
+        self._mmap = None
+        self._sa = self._build_suffix_array(self._text)
+        self._lcp = self._build_lcp(self._text, self._sa)
+
+    @staticmethod
+    def _build_suffix_array(text: bytes) -> array:
+        """Sort suffixes by their first 2^k bytes for k = 0, 1, 2, ... until all differ."""
+        n = len(text)
+        sa = list(range(n))
+        rank = list(text)
+        base = max(n, 256) + 1  # ranks are byte values first, then below n
+        k = 1
+        while True:
+            # a suffix shorter than k sorts before any longer one with the same prefix
+            sort_key = [
+                (rank[i] + 1) * base + (rank[i + k] + 1 if i + k < n else 0)
+                for i in range(n)
+            ]
+            sa.sort(key=sort_key.__getitem__)
+            new_rank = [0] * n
+            for j in range(1, n):
+                new_rank[sa[j]] = new_rank[sa[j - 1]] + (
+                    sort_key[sa[j]] != sort_key[sa[j - 1]]
+                )
+            rank = new_rank
+            if n == 0 or rank[sa[-1]] == n - 1:
+                break
+            k *= 2
+        return array("q", sa)
+
+    @staticmethod
+    def _build_lcp(text: bytes, sa: array) -> array:
+        """Compute the LCP array with Kasai's algorithm in O(n)."""
+        n = len(text)
+        rank = array("q", bytes(8 * n))
+        for i, start in enumerate(sa):
+            rank[start] = i
+        lcp = array("q", bytes(8 * n))
+        h = 0
+        for i in range(n):
+            if rank[i] > 0:
+                j = sa[rank[i] - 1]
+                while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                    h += 1
+                lcp[rank[i]] = h
+                if h > 0:
+                    h -= 1
+            else:
+                h = 0
+        return lcp
+
+    def __len__(self) -> int:
+        """Return the length of the indexed text in bytes."""
+        return self._n
+
+    @property
+    def suffix_array(self) -> Any:
+        """Return the suffix array (array.array or memoryview of 64-bit integers)."""
+        return self._sa
+
+    @property
+    def lcp(self) -> Any:
+        """Return the LCP array (array.array or memoryview of 64-bit integers)."""
+        return self._lcp
+
+    def _range(self, pattern: str | bytes) -> tuple[int, int]:
+        """Return the half-open range of suffix ranks starting with pattern."""
+        if isinstance(pattern, str):
+            pattern = pattern.encode()
+        text, offset, m, n = self._text, self._text_offset, len(pattern), self._n
+
+        # a loaded text is followed by other file data, so clip at its end
+        def prefix(start: int) -> bytes:
+            return text[offset + start : offset + min(start + m, n)]
+
+        first = lower_bound(self._sa, pattern, key=prefix)
+        last = upper_bound(self._sa, pattern, first, key=prefix)
+        return (first, last)
+
+    def count(self, pattern: str | bytes) -> int:
+        """Return the number of occurrences of pattern in the text.
+
+        Time complexity: O(m log(n))
+        """
+        first, last = self._range(pattern)
+        return last - first
+
+    def locate(self, pattern: str | bytes) -> list[int]:
+        """Return the start offset of every occurrence of pattern in increasing order.
+
+        Time complexity: O(m log(n) + k log(k)) for k occurrences
+        """
+        first, last = self._range(pattern)
+        return sorted(self._sa[first:last])
+
+    def save(self, path: str | os.PathLike) -> None:
+        """Write the text, suffix array and LCP array to path."""
+        with open(path, "wb") as out:
+            out.write(_HEADER.pack(_MAGIC, self._n))
+            out.write(self._text[self._text_offset : self._text_offset + self._n])
+            out.write(bytes(-(_HEADER.size + self._n) % 8))
+            out.write(self._sa)
+            out.write(self._lcp)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> "SuffixArray":
+        """Memory-map an index written by save() without rebuilding it.
+
+        Raises:
+            ValueError: If the file isn't a suffix array of this byte order.
+        """
+        with open(path, "rb") as file:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC:
+            mm.close()
+            raise ValueError(f"{path} is not a suffix array file of this byte order")
+        sa_offset = _HEADER.size + n + (-(_HEADER.size + n) % 8)
+        view = memoryview(mm)
+        index = cls.__new__(cls)
+        index._mmap = mm
+        index._text = mm
+        index._text_offset = _HEADER.size
+        index._n = n
+        index._sa = view[sa_offset : sa_offset + 8 * n].cast("q")
+        index._lcp = view[sa_offset + 8 * n : sa_offset + 16 * n].cast("q")
+        return index
+
+    def close(self) -> None:
+        """Release the memory map of an index opened with load()."""
+        if self._mmap is not None:
+            self._sa.release()
+            self._lcp.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "SuffixArray":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    index = SuffixArray("banana")
+    print(f"suffix array: {list(index.suffix_array)}")
+    print(f"lcp: {list(index.lcp)}")
+    print(f"count 'ana': {index.count('ana')}")
+    print(f"locate 'ana': {index.locate('ana')}")
+    print(f"locate 'nab': {index.locate('nab')}")
+
+    path = os.path.join(tempfile.mkdtemp(), "banana.sa")
+    index.save(path)
+    with SuffixArray.load(path) as loaded:
+        print(f"loaded locate 'a': {loaded.locate('a')}")
+    os.remove(path)
+
+    # patterns running past the last suffix match neither index
+    index = SuffixArray(b"xyzabc")
+    index.save(path)
+    with SuffixArray.load(path) as loaded:
+        for pattern in (b"c\x00", b"bc\x00", b"abc"):
+            same = (index.count(pattern), index.locate(pattern)) == (
+                loaded.count(pattern),
+                loaded.locate(pattern),
+            )
+            print(f"{pattern!r}: count {loaded.count(pattern)}, same: {same}")
+    os.remove(path)
+
+    ###########################################################################
+
+    # -------------------------------OUTPUT------------------------------------
+    # suffix array: [5, 3, 1, 0, 4, 2]
+    # lcp: [0, 1, 3, 0, 0, 2]
+    # count 'ana': 2
+    # locate 'ana': [1, 3]
+    # locate 'nab': []
+    # loaded locate 'a': [1, 3, 5]
+    # b'c\x00': count 0, same: True
+    # b'bc\x00': count 0, same: True
+    # b'abc': count 1, same: True
+
+    ###########################################################################
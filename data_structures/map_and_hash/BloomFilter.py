@@ -0,0 +1,167 @@
+import math
+from typing import Hashable, Iterable
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(x: int) -> int:
+    """Scramble the bits of a 64-bit integer (splitmix64 finalizer)."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+class BloomFilter:
+    """Bloom filter: a compact set that may report false positives but never misses.
+
+    Bits live in a bytearray. The k bit positions of a key are derived from two hashes
+    by double hashing, h1 + i * h2 (mod m), so only one call to hash() is needed per
+    key. Keys are hashed with the built-in hash(), so filters must be built in the same
+    process to be combined.
+    """
+
+    __slots__ = ("_bits", "_m", "_k", "_capacity", "_error_rate", "_count")
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        """Create an empty filter sized for capacity keys.
+
+        Args:
+            capacity (int): Expected number of keys.
+            error_rate (float): Accepted false-positive rate at capacity keys.
+
+        Raises:
+            ValueError: If capacity isn't positive or error_rate isn't in (0, 1).
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self._capacity = capacity
+        self._error_rate = error_rate
+        # optimal m = -n ln(p) / ln(2)^2 bits and k = (m / n) ln(2) hashes
+        bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        self._m = max(8, math.ceil(bits))
+        self._k = max(1, round(self._m / capacity * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self._count = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"BloomFilter(capacity={self._capacity}, error_rate={self._error_rate}, "
+            f"bits={self._m}, hashes={self._k})"
+        )
+
+    def __len__(self) -> int:
+        """Return the number of add() calls (duplicates are counted again)."""
+        return self._count
+
+    @property
+    def num_bits(self) -> int:
+        """Return the size m of the bit array."""
+        return self._m
+
+    @property
+    def num_hashes(self) -> int:
+        """Return the number k of bits set per key."""
+        return self._k
+
+    def _positions(self, key: Hashable) -> range:
+        """Return the k bit positions of key, as a range to be reduced mod m."""
+        # the two 32-bit halves of one scrambled hash serve as h1 and h2
+        x = _mix(hash(key) & _MASK)
+        h2 = (x >> 32) | 1
+        return range(x & 0xFFFFFFFF, (x & 0xFFFFFFFF) + self._k * h2, h2)
+
+    def add(self, key: Hashable) -> None:
+        """Add key to the filter. Time complexity: O(k)"""
+        bits, m = self._bits, self._m
+        for pos in self._positions(key):
+            pos %= m
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def update(self, keys: Iterable[Hashable]) -> None:
+        """Add every key of an iterable."""
+        bits, m, positions = self._bits, self._m, self._positions
+        added = 0
+        for key in keys:
+            for pos in positions(key):
+                pos %= m
+                bits[pos >> 3] |= 1 << (pos & 7)
+            added += 1
+        self._count += added
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return False if key was never added, True if it probably was.
+
+        Time complexity: O(k)
+        """
+        bits, m = self._bits, self._m
+        for pos in self._positions(key):
+            pos %= m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def _check_compatible(self, other: "BloomFilter") -> None:
+        """Raise ValueError unless other has the same bit array size and hash count."""
+        if not isinstance(other, BloomFilter):
+            raise TypeError(f"can't combine BloomFilter with {type(other).__name__}")
+        if (self._m, self._k) != (other._m, other._k):
+            raise ValueError("filters must have the same number of bits and hashes")
+
+    def union(self, other: "BloomFilter") -> "BloomFilter":
+        """Return a filter holding the keys of both filters.
+
+        Raises:
+            ValueError: If the filters were created with different sizes.
+        """
+        self._check_compatible(other)
+        result = BloomFilter(self._capacity, self._error_rate)
+        result._bits[:] = self._bits
+        result._count = self._count
+        result |= other
+        return result
+
+    def __or__(self, other: "BloomFilter") -> "BloomFilter":
+        return self.union(other)
+
+    def __ior__(self, other: "BloomFilter") -> "BloomFilter":
+        self._check_compatible(other)
+        merged = int.from_bytes(self._bits, "little") | int.from_bytes(
+            other._bits, "little"
+        )
+        self._bits[:] = merged.to_bytes(len(self._bits), "little")
+        self._count += other._count
+        return self
+
+    def estimated_error_rate(self) -> float:
+        """Return the false-positive rate implied by the fraction of bits set."""
+        ones = int.from_bytes(self._bits, "little").bit_count()
+        return (ones / self._m) ** self._k
+
+
+if __name__ == "__main__":
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    print(bloom)
+    bloom.update(range(0, 2000, 2))
+    print(f"42 in filter: {42 in bloom}")
+    false_positives = sum(key in bloom for key in range(1, 2000, 2))
+    print(f"false positives among 1000 odd keys: {false_positives}")
+    print(f"estimated error rate: {bloom.estimated_error_rate():.4f}")
+
+    other = BloomFilter(capacity=1000, error_rate=0.01)
+    other.update(["apple", "banana"])
+    both = bloom | other
+    print(f"'apple' in union: {'apple' in both}, 42 in union: {42 in both}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # BloomFilter(capacity=1000, error_rate=0.01, bits=9586, hashes=7)
+    # 42 in filter: True
+    # false positives among 1000 odd keys: 9
+    # estimated error rate: 0.0099
+    # 'apple' in union: True, 42 in union: True
+
+    ###########################################################################
@@ -0,0 +1,102 @@
+from typing import Iterator
+
+from BloomFilter import BloomFilter
+from MapBase import MapBase, K, V
+
+
+class BloomFilteredMap(MapBase):
+    """Map that puts a BloomFilter in front of any other map.
+
+    A key the filter has never seen is a guaranteed miss, so lookups of it return
+    without touching the backing map. Deleted keys stay in the filter (bits can't be
+    cleared), which only costs an occasional lookup in the backing map.
+    """
+
+    __slots__ = ("_map", "_filter")
+
+    def __init__(
+        self, backing: MapBase, capacity: int = 1024, error_rate: float = 0.01
+    ) -> None:
+        """Wrap backing, adding its current keys to a new filter.
+
+        Args:
+            backing (MapBase): The map that holds the items.
+            capacity (int): Expected number of keys, used to size the filter.
+            error_rate (float): Accepted false-positive rate of the filter.
+        """
+        self._map = backing
+        self._filter = BloomFilter(max(capacity, len(backing), 1), error_rate)
+        self._filter.update(backing)
+
+    def __repr__(self) -> str:
+        return f"BloomFilteredMap({self._map!r}, {self._filter!r})"
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __getitem__(self, key: K) -> V:
+        """Return the value of key, skipping the backing map if the filter rules it out.
+
+        Raises:
+            KeyError: If key is not found.
+        """
+        if key not in self._filter:
+            raise KeyError("Key Error: " + repr(key))
+        return self._map[key]
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._filter and key in self._map
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._map[key] = value
+        self._filter.add(key)
+
+    def __delitem__(self, key: K) -> None:
+        """Remove key from the backing map (raise KeyError if not found)."""
+        if key not in self._filter:
+            raise KeyError("Key Error: " + repr(key))
+        del self._map[key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._map)
+
+
+if __name__ == "__main__":
+    import time
+
+    from ChainHashMap import ChainHashMap
+    from UnsortedMap import UnsortedMap
+
+    chain = ChainHashMap()
+    for key in range(0, 20_000, 2):
+        chain[key] = str(key)
+    bloomed = BloomFilteredMap(chain, capacity=10_000)
+    print(f"bloomed[42]: {bloomed[42]}, 43 in bloomed: {43 in bloomed}")
+    bloomed[43] = "43"
+    print(f"after insert, 43 in bloomed: {43 in bloomed}")
+
+    # missed lookups: cheap for a hash map, a full scan for an UnsortedMap
+    unsorted = UnsortedMap()
+    for key in range(0, 2_000, 2):
+        unsorted[key] = str(key)
+    misses = range(100_001, 120_001, 2)
+    for name, mapping in (
+        ("ChainHashMap", chain),
+        ("BloomFilteredMap(ChainHashMap)", bloomed),
+        ("UnsortedMap", unsorted),
+        ("BloomFilteredMap(UnsortedMap)", BloomFilteredMap(unsorted, capacity=1_000)),
+    ):
+        start = time.perf_counter()
+        found = sum(key in mapping for key in misses)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {len(misses) / elapsed:,.0f} missed lookups/s ({found} found)")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # bloomed[42]: 42, 43 in bloomed: False
+    # after insert, 43 in bloomed: True
+
+    # lookup timings depend on the machine
+
+    ###########################################################################
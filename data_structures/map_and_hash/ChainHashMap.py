@@ -8,18 +8,24 @@ class ChainHashMap(HashMapBase):
 
     def __repr__(self) -> str:
         """Return a string representation of the hash map."""
-        chain_str = "["
-        for bucket in self._table:
-            if bucket is not None:
-                chain_str += "["
-                for key in bucket:
-                    chain_str += f"({key}, {bucket[key]}), "
-                chain_str = chain_str[:-2] + "], "
-            else:
-                chain_str += " , "
-
-        chain_str = chain_str[:-2] + "]"
-        return f"\n{chain_str}\nLength: {len(self._table)}\n"
+        tables = [self._table]
+        if self._old_table is not None:  # items not yet migrated are still there
+            tables.append(self._old_table)
+        lines = []
+        for table in tables:
+            chain_str = "["
+            for bucket in table:
+                if bucket is not None:
+                    chain_str += "["
+                    for key in bucket:
+                        chain_str += f"({key}, {bucket[key]}), "
+                    chain_str = chain_str[:-2] + "], "
+                else:
+                    chain_str += " , "
+
+            chain_str = chain_str[:-2] + "]"
+            lines.append(f"\n{chain_str}\nLength: {len(table)}\n")
+        return "Old table:".join(lines)
 
     def _bucket_getitem(self, hashed: int, key: K) -> V:
         """Return the value associated with key in the bucket for key.
@@ -76,10 +82,13 @@ class ChainHashMap(HashMapBase):
         self._n -= 1
 
     def __iter__(self) -> Iterator[K]:
-        for bucket in self._table:
-            if bucket is not None:
-                for key in bucket:
-                    yield key
+        for bucket in self._buckets():
+            for key in bucket:
+                yield key
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        for bucket in self._buckets():
+            yield from range(1, len(bucket) + 1)
 
 
 if __name__ == "__main__":
@@ -108,3 +117,10 @@ if __name__ == "__main__":
     chain_str["name"] = "ramesh"
     chain_str["age"] = 21
     print(chain_str)
+
+    # bulk construction, sized once for all items
+    bulk = ChainHashMap.from_items([(i, i * i) for i in range(10)])
+    print(f"bulk: {len(bulk)} items, table length {len(bulk._table)}")
+    print(f"get_many: {bulk.get_many([2, 3, 42], default='missing')}")
+    bulk.delete_many([2, 3])
+    print(f"after delete_many: {len(bulk)} items")
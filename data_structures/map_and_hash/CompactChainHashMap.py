@@ -0,0 +1,171 @@
+from array import array
+from typing import Iterable, Iterator
+
+from HashMapBase import HashMapBase
+from MapBase import K, V
+
+_DELETED = object()  # marks a dense entry whose item was deleted
+
+
+class CompactChainHashMap(HashMapBase):
+    """Hash map with separate chaining in a compact, insertion-ordered layout.
+
+    Like CPython's dict, items aren't stored in the bucket table. They're appended
+    to dense parallel arrays of cached hash codes, keys and values, and _table only
+    holds, for every bucket, the dense index of the first entry of its chain (-1 if
+    empty); _next links the entries of a chain. No per-item or per-bucket objects are
+    allocated, iteration follows insertion order, and a resize rebuilds the chains
+    from the cached hash codes without hashing any key again.
+    """
+
+    def __init__(self, cap=7, prime=1_999_999_777):
+        """Create an empty hash table map."""
+        super().__init__(cap, prime)
+        self._table = array("q", [-1]) * cap
+        self._hashes = array("q")
+        self._keys: list = []
+        self._values: list = []
+        self._next = array("q")
+        self._deleted = 0  # number of deleted entries in the dense arrays
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hash map."""
+        items = ", ".join(f"({key}, {self[key]})" for key in self)
+        return f"\n[{items}]\nLength: {len(self._table)}\n"
+
+    def _find(self, hashed: int, key: K) -> int:
+        """Return the dense index of key in the chain of bucket hashed, or -1."""
+        keys, link = self._keys, self._next
+        i = self._table[hashed]
+        while i >= 0:
+            if keys[i] is key or keys[i] == key:
+                return i
+            i = link[i]
+        return -1
+
+    def _bucket_getitem(self, hashed: int, key: K) -> V:
+        """Return the value associated with key in the chain of bucket hashed.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        i = self._find(hashed, key)
+        if i < 0:
+            raise KeyError("Key Error: " + repr(key))
+        return self._values[i]
+
+    def _insert(self, code: int, key: K, value: V) -> None:
+        """Set the value for key with hash code code, appending an entry if it's new."""
+        hashed = code % len(self._table)
+        i = self._find(hashed, key)
+        if i >= 0:
+            self._values[i] = value
+            return
+        self._next.append(self._table[hashed])
+        self._table[hashed] = len(self._keys)
+        self._hashes.append(code)
+        self._keys.append(key)
+        self._values.append(value)
+        self._n += 1
+
+    def _bucket_setitem(self, hashed: int, key: K, value: V) -> None:
+        """Set the value for key in bucket hashed, hashing key again for its code."""
+        self._insert(self._hash_code(key), key, value)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Assign value to key, hashing key only once."""
+        self._insert(self._hash_code(key), key, value)
+        if self._n > len(self._table) * self._max_load:
+            self._resize()
+
+    def _set_all(self, pairs: Iterable[tuple[K, V]]) -> None:
+        """Insert pairs in one loop, hashing every key only once."""
+        hash_code, insert = self._hash_code, self._insert
+        for k, v in pairs:
+            insert(hash_code(k), k, v)
+            if self._n > len(self._table) * self._max_load:
+                self.reserve(2 * self._n)
+
+    def _bucket_delitem(self, hashed: int, key: K) -> None:
+        """Unlink the entry of key from its chain and mark it deleted.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        prev, i = -1, self._table[hashed]
+        keys = self._keys
+        while i >= 0 and not (keys[i] is key or keys[i] == key):
+            prev, i = i, self._next[i]
+        if i < 0:
+            raise KeyError("Key Error: " + repr(key))
+        if prev < 0:
+            self._table[hashed] = self._next[i]
+        else:
+            self._next[prev] = self._next[i]
+        keys[i] = _DELETED
+        self._values[i] = None
+        self._n -= 1
+        self._deleted += 1
+        if self._deleted > len(keys) // 2:
+            self._rebuild(len(self._table))
+
+    def __iter__(self) -> Iterator[K]:
+        for key in self._keys:
+            if key is not _DELETED:
+                yield key
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        for head in self._table:
+            length, i = 0, head
+            while i >= 0:
+                length += 1
+                yield length
+                i = self._next[i]
+
+    def _rebuild(self, cap: int) -> None:
+        """Drop deleted entries and relink all chains into a table of cap buckets."""
+        if self._deleted:
+            live = [i for i, key in enumerate(self._keys) if key is not _DELETED]
+            self._hashes = array("q", [self._hashes[i] for i in live])
+            self._keys = [self._keys[i] for i in live]
+            self._values = [self._values[i] for i in live]
+            self._deleted = 0
+        table = array("q", [-1]) * cap
+        link = array("q", [-1]) * len(self._keys)
+        for i, code in enumerate(self._hashes):
+            hashed = code % cap
+            link[i] = table[hashed]
+            table[hashed] = i
+        self._table = table
+        self._next = link
+
+    def _resize(self, new_cap: int | None = None):
+        """Resize the bucket table, reusing the cached hash codes."""
+        self._rebuild(new_cap or 2 * len(self._table) - 1)
+
+
+if __name__ == "__main__":
+    compact = CompactChainHashMap()
+    compact[3] = "c"
+    compact[1] = "a"
+    compact[2] = "b"
+    compact[5] = "e"
+    compact[4] = "d"
+    print(compact)
+
+    compact[5] = "z"
+    del compact[2]
+    print(f"key: 1, value: {compact[1]}, 2 in map: {2 in compact}")
+    print(f"insertion order: {list(compact.items())}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    #
+    # [(3, c), (1, a), (2, b), (5, e), (4, d)]
+    # Length: 13
+    #
+    # key: 1, value: a, 2 in map: False
+    # insertion order: [(3, 'c'), (1, 'a'), (5, 'z'), (4, 'd')]
+
+    ###########################################################################
@@ -0,0 +1,306 @@
+import threading
+from collections.abc import ItemsView, ValuesView
+from typing import Any, Callable, Iterable, Iterator
+
+from HashMapBase import HashMapBase
+from MapBase import K, V
+from UnsortedMap import UnsortedMap
+
+_MISSING = object()  # default of pop() when no default is given
+
+
+class _ItemsView(ItemsView):
+    """Items view of a ConcurrentHashMap, iterating over locked bucket snapshots."""
+
+    def __iter__(self) -> Iterator[tuple[K, V]]:
+        for items in self._mapping._snapshots():
+            yield from items
+
+
+class _ValuesView(ValuesView):
+    """Values view of a ConcurrentHashMap, iterating over locked bucket snapshots."""
+
+    def __iter__(self) -> Iterator[V]:
+        for items in self._mapping._snapshots():
+            for _, v in items:
+                yield v
+
+
+class ConcurrentHashMap(HashMapBase):
+    """Thread-safe hash map with separate chaining and lock striping.
+
+    The bucket table is partitioned into stripes, bucket j being guarded by lock
+    j % stripes, so threads working on keys of different stripes don't wait for each
+    other. Only a resize takes every lock. Item counts are kept per stripe, so no
+    shared counter is written by every insertion.
+
+    Iteration is weakly consistent: it never fails because of concurrent updates and
+    yields every key present when it started and not removed since, but may or may
+    not reflect later changes. Functions passed to compute_if_absent and update_value
+    run under the stripe lock and must not modify the map.
+    """
+
+    def __init__(self, cap=7, prime=1_999_999_777, stripes: int = 16):
+        """Create an empty hash table map.
+
+        Args:
+            cap (int): Initial number of buckets.
+            prime (int): Prime of the MAD hash.
+            stripes (int): Number of locks the buckets are partitioned into.
+        """
+        super().__init__(cap, prime)
+        self._locks = [threading.RLock() for _ in range(stripes)]
+        self._counts = [0] * stripes  # number of items per stripe
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def _acquire(self, key: K) -> int:
+        """Lock the stripe of the bucket of key and return the bucket index."""
+        code = self._hash_code(key)
+        while True:
+            table = self._table
+            hashed = code % len(table)
+            lock = self._locks[hashed % len(self._locks)]
+            lock.acquire()
+            if table is self._table:
+                return hashed
+            lock.release()  # resized meanwhile, the key may be in another stripe
+
+    def _release(self, hashed: int) -> None:
+        """Unlock the stripe of bucket hashed."""
+        self._locks[hashed % len(self._locks)].release()
+
+    def _bucket_getitem(self, hashed: int, key: K) -> V:
+        """Return the value of key in bucket hashed (raise KeyError if not found)."""
+        bucket = self._table[hashed]
+        if bucket is None:
+            raise KeyError("Key Error: " + repr(key))
+        return bucket[key]
+
+    def _bucket_setitem(self, hashed: int, key: K, value: V) -> None:
+        """Set the value of key in bucket hashed."""
+        bucket = self._table[hashed]
+        if bucket is None:
+            bucket = self._table[hashed] = UnsortedMap()
+        size = len(bucket)
+        bucket[key] = value
+        if len(bucket) > size:
+            self._counts[hashed % len(self._locks)] += 1
+
+    def _bucket_delitem(self, hashed: int, key: K) -> None:
+        """Remove key from bucket hashed (raise KeyError if not found)."""
+        bucket = self._table[hashed]
+        if bucket is None:
+            raise KeyError("Key Error: " + repr(key))
+        del bucket[key]
+        if len(bucket) == 0:
+            self._table[hashed] = None
+        self._counts[hashed % len(self._locks)] -= 1
+
+    def __getitem__(self, key: K) -> V:
+        """Return value associated with key (raise KeyError if not found)."""
+        hashed = self._acquire(key)
+        try:
+            return self._bucket_getitem(hashed, key)
+        finally:
+            self._release(hashed)
+
+    def __setitem__(self, key: K, value: V) -> None:
+        """Assign value to key."""
+        hashed = self._acquire(key)
+        try:
+            self._bucket_setitem(hashed, key, value)
+        finally:
+            self._release(hashed)
+        self._grow_if_full()
+
+    def __delitem__(self, key: K) -> None:
+        """Remove item associated with key (raise KeyError if not found)."""
+        hashed = self._acquire(key)
+        try:
+            self._bucket_delitem(hashed, key)
+        finally:
+            self._release(hashed)
+
+    def pop(self, key: K, default: V = _MISSING) -> V:
+        """Remove key and return its value, or default if key is absent (atomic).
+
+        Raises:
+            KeyError: If key is not in the map and no default is given.
+        """
+        hashed = self._acquire(key)
+        try:
+            try:
+                value = self._bucket_getitem(hashed, key)
+            except KeyError:
+                if default is _MISSING:
+                    raise
+                return default
+            self._bucket_delitem(hashed, key)
+            return value
+        finally:
+            self._release(hashed)
+
+    def popitem(self) -> tuple[K, V]:
+        """Remove and return some (key, value) pair.
+
+        Raises:
+            KeyError: If the map is empty.
+        """
+        for items in self._snapshots():
+            for k, _ in items:
+                try:
+                    return (k, self.pop(k))
+                except KeyError:
+                    pass  # another thread removed k first
+        raise KeyError("Key Error: map is empty")
+
+    def setdefault(self, key: K, default: V = None) -> V:
+        """Return the value of key, inserting default first if it's absent (atomic)."""
+        return self.get_or_insert(key, default)
+
+    def get_or_insert(self, key: K, value: V) -> V:
+        """Return the value of key, first inserting value if key is absent (atomic)."""
+        return self.compute_if_absent(key, lambda _: value)
+
+    def compute_if_absent(self, key: K, fn: Callable[[K], V]) -> V:
+        """Return the value of key, inserting fn(key) if key is absent (atomic).
+
+        fn is called at most once, and only if key is absent.
+        """
+        hashed = self._acquire(key)
+        try:
+            try:
+                return self._bucket_getitem(hashed, key)
+            except KeyError:
+                value = fn(key)
+                self._bucket_setitem(hashed, key, value)
+        finally:
+            self._release(hashed)
+        self._grow_if_full()
+        return value
+
+    def update_value(self, key: K, fn: Callable[[V], V], default: V = None) -> V:
+        """Replace the value of key by fn(value) atomically and return the new value.
+
+        Args:
+            key (K): Key to be updated.
+            fn (Callable[[V], V]): Computes the new value from the old one.
+            default (V): Passed to fn if key is absent.
+
+        Returns:
+            (V): The new value of key.
+        """
+        hashed = self._acquire(key)
+        try:
+            try:
+                old = self._bucket_getitem(hashed, key)
+            except KeyError:
+                old = default
+            value = fn(old)
+            self._bucket_setitem(hashed, key, value)
+        finally:
+            self._release(hashed)
+        self._grow_if_full()
+        return value
+
+    def _grow_if_full(self) -> None:
+        """Resize if the load factor exceeds _max_load (no stripe lock may be held)."""
+        if len(self) > len(self._table) * self._max_load:
+            self._resize()
+
+    def _resize(self, new_cap: int | None = None):
+        """Rebuild the bucket table while holding every stripe lock."""
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            old = self._table
+            if new_cap is None:
+                if len(self) <= len(old) * self._max_load:
+                    return  # another thread resized first
+                new_cap = 2 * len(old) - 1
+            self._table = [None] * new_cap
+            self._counts = [0] * len(self._locks)
+            for bucket in old:
+                if bucket is not None:
+                    for k, v in bucket.items():
+                        self._bucket_setitem(self._hash(k), k, v)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _snapshots(self) -> Iterator[list[tuple[K, V]]]:
+        """Generate a copy of the items of every bucket, taken under its lock."""
+        table = self._table
+        stripes = len(self._locks)
+        for j in range(len(table)):
+            if table[j] is None:
+                continue
+            with self._locks[j % stripes]:
+                bucket = table[j]
+                items = [] if bucket is None else list(bucket.items())
+            yield items
+
+    def __iter__(self) -> Iterator[K]:
+        for items in self._snapshots():
+            for k, _ in items:
+                yield k
+
+    def items(self) -> ItemsView:
+        """Return a view of the (key, value) pairs, iterated weakly consistently."""
+        return _ItemsView(self)
+
+    def values(self) -> ValuesView:
+        """Return a view of the values, iterated weakly consistently."""
+        return _ValuesView(self)
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        for items in self._snapshots():
+            yield from range(1, len(items) + 1)
+
+    def _set_all(self, pairs: Iterable[tuple[K, V]]) -> None:
+        """Insert pairs one at a time under their stripe locks."""
+        for k, v in pairs:
+            self[k] = v
+
+    def get_many(self, keys: Iterable[K], default: Any = None) -> list:
+        """Return the value of every key, default for keys not in the map."""
+        return [self.get(k, default) for k in keys]
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Remove every key (raise KeyError at the first key not found)."""
+        for k in keys:
+            del self[k]
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ThreadPoolExecutor
+
+    counters = ConcurrentHashMap()
+
+    def count_words(words: list[str]) -> None:
+        for word in words:
+            counters.update_value(word, lambda n: n + 1, default=0)
+
+    text = "the quick brown fox jumps over the lazy dog the end".split()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for _ in range(100):
+            pool.submit(count_words, text)
+    print(f"the: {counters['the']}, fox: {counters['fox']}, words: {len(counters)}")
+
+    print(counters.get_or_insert("cat", 0), counters.get_or_insert("the", 0))
+    print(counters.compute_if_absent("owl", len), sorted(counters)[:3])
+
+    items = counters.items()  # a view, like the other maps' items()
+    print(len(items), ("the", 300) in items, counters.pop("cat"), len(items))
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # the: 300, fox: 100, words: 9
+    # 0 300
+    # 3 ['brown', 'cat', 'dog']
+    # 11 True 0 10
+
+    ###########################################################################
@@ -0,0 +1,227 @@
+import random
+from typing import Iterator
+
+from BloomFilter import _MASK, _mix
+from HashMapBase import HashMapBase
+from MapBase import K, V
+
+_SLOTS = 4  # slots per bucket
+_EMPTY = object()  # marks a free slot, so that None can be a key
+
+
+class CuckooHashMap(HashMapBase):
+    """Hash map with two-table cuckoo hashing and buckets of four slots.
+
+    A key may only live in one of two buckets: bucket h1(key) of the first table or
+    bucket h2(key) of the second one, so a search inspects at most eight slots. If
+    both buckets of a new key are full, it evicts a random key of one of them, which
+    moves to its other bucket, possibly evicting another key, and so on; if this
+    doesn't end within _max_kicks moves, the tables grow. Both tables live in the
+    flat lists _table and _values: slots [0, 4 * nb) form the first table and
+    [4 * nb, 8 * nb) the second, nb being the number of buckets per table.
+    """
+
+    _max_kicks = 500  # evictions tried before the tables grow
+
+    def __init__(self, cap=8, prime=1_999_999_777, max_load: float = 0.9):
+        """Create an empty hash table map.
+
+        Args:
+            cap (int): Initial number of slots, rounded up to a multiple of 8.
+            prime (int): Prime of the MAD hashes.
+            max_load (float): Load factor above which the tables grow, below 1.
+
+        Raises:
+            ValueError: If max_load isn't in (0, 1).
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+        super().__init__(cap, prime)
+        self._max_load = max_load
+        self._salt2 = random.getrandbits(64)  # seed of the second hash
+        self._allocate(cap)
+
+    def _allocate(self, cap: int) -> None:
+        """Replace the tables by empty ones of at least cap slots in total."""
+        self._nb = max(1, -(-cap // (2 * _SLOTS)))
+        self._table = 2 * _SLOTS * self._nb * [_EMPTY]
+        self._values: list = 2 * _SLOTS * self._nb * [None]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hash map."""
+        items = ", ".join(f"({key}, {self[key]})" for key in self)
+        return f"\n[{items}]\nLength: {len(self._table)}\n"
+
+    def _hash_code(self, key: K) -> int:
+        """Return the scrambled MAD hash of key, the code of its first bucket.
+
+        A plain MAD hash maps runs of int keys to evenly spaced codes that may fall
+        into a fraction of the buckets, which cuckoo hashing can't tolerate.
+        """
+        return _mix(super()._hash_code(key))
+
+    def _starts(self, key: K, hashed: int | None = None) -> tuple[int, int]:
+        """Return the first slots of the two buckets of key."""
+        if hashed is None:
+            hashed = self._hash_code(key)
+        # a second MAD hash would be correlated with the first one for int keys
+        code2 = _mix((hash(key) ^ self._salt2) & _MASK)
+        return (
+            hashed % self._nb * _SLOTS,
+            (self._nb + code2 % self._nb) * _SLOTS,
+        )
+
+    def _find(self, hashed: int, key: K) -> int:
+        """Return the slot of key, or -1 if key is not in the map."""
+        table = self._table
+        for start in self._starts(key, hashed):
+            for j in range(start, start + _SLOTS):
+                if table[j] is not _EMPTY and table[j] == key:
+                    return j
+        return -1
+
+    def _bucket_getitem(self, hashed: int, key: K) -> V:
+        """Return the value associated with key in one of its two buckets.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        j = self._find(hashed, key)
+        if j < 0:
+            raise KeyError("Key Error: " + repr(key))
+        return self._values[j]
+
+    def _place(self, key: K, value: V) -> bool:
+        """Insert a key that is not in the map, evicting keys as needed.
+
+        Returns:
+            (bool): True on success. False if the item is still left without a slot
+                after _max_kicks evictions, in which case the evictions are undone.
+        """
+        table, values = self._table, self._values
+        first, second = self._starts(key)
+        for start in (first, second):
+            for j in range(start, start + _SLOTS):
+                if table[j] is _EMPTY:
+                    table[j], values[j] = key, value
+                    return True
+        path = []  # slots whose item was evicted, in order
+        start = random.choice((first, second))
+        for _ in range(self._max_kicks):
+            j = start + random.randrange(_SLOTS)
+            path.append(j)
+            table[j], key = key, table[j]
+            values[j], value = value, values[j]
+            # the evicted key moves to its other bucket
+            first, second = self._starts(key)
+            start = second if first == start else first
+            for j in range(start, start + _SLOTS):
+                if table[j] is _EMPTY:
+                    table[j], values[j] = key, value
+                    return True
+        # move every evicted item back, leaving the original one in hand
+        for j in reversed(path):
+            table[j], key = key, table[j]
+            values[j], value = value, values[j]
+        return False
+
+    def _bucket_setitem(self, hashed: int, key: K, value: V) -> None:
+        """Set the value for key, growing the tables if key can't be placed."""
+        j = self._find(hashed, key)
+        if j >= 0:
+            self._values[j] = value
+            return
+        if not self._place(key, value):
+            self._rehash(2 * len(self._table), (key, value))
+        self._n += 1
+
+    def _bucket_delitem(self, hashed: int, key: K) -> None:
+        """Remove key from its bucket.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        j = self._find(hashed, key)
+        if j < 0:
+            raise KeyError("Key Error: " + repr(key))
+        self._table[j], self._values[j] = _EMPTY, None
+        self._n -= 1
+
+    def __iter__(self) -> Iterator[K]:
+        for key in self._table:
+            if key is not _EMPTY:
+                yield key
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        for j, key in enumerate(self._table):
+            if key is not _EMPTY:
+                first, second = self._starts(key)
+                if first <= j < first + _SLOTS:
+                    yield j - first + 1
+                else:
+                    yield _SLOTS + j - second + 1
+
+    def _rehash(self, cap: int, extra: tuple[K, V] | None = None) -> None:
+        """Reinsert every item, and extra if given, into tables of at least cap slots.
+
+        Raises:
+            RuntimeError: If the items can't be placed even in very large tables,
+                which happens when more than 8 keys have the same hash(). The map
+                is left unchanged.
+        """
+        old = (self._nb, self._table, self._values)
+        items = [(k, v) for k, v in zip(self._table, self._values) if k is not _EMPTY]
+        if extra is not None:
+            items.append(extra)
+        while True:
+            self._allocate(cap)
+            if all(self._place(k, v) for k, v in items):
+                return
+            if cap > 64 * (len(items) + _SLOTS):
+                self._nb, self._table, self._values = old
+                raise RuntimeError("too many keys with the same hash")
+            cap *= 2
+
+    def _resize(self, new_cap: int | None = None):
+        """Resize both tables to a new capacity."""
+        self._rehash(new_cap or 2 * len(self._table))
+
+
+if __name__ == "__main__":
+    cuckoo = CuckooHashMap()
+    for i in range(1, 6):
+        cuckoo[i * 7] = chr(ord("a") + i - 1)
+    cuckoo[35] = "z"
+    del cuckoo[14]
+    print(f"items: {sorted(cuckoo.items())}, 14 in map: {14 in cuckoo}")
+
+    # presized for 90% load
+    cuckoo = CuckooHashMap(max_load=0.9)
+    cuckoo.reserve(9_000)
+    cuckoo.update_many((i, i) for i in range(9_000))
+    print(f"load: {len(cuckoo) / len(cuckoo._table):.2f}")
+    print(f"longest probe: {max(cuckoo.probe_lengths())} slots")
+
+    # hash(i * (2**61 - 1)) is 0 for every int i: only 8 slots can hold such keys
+    colliding = CuckooHashMap()
+    try:
+        for i in range(9):
+            colliding[i * (2**61 - 1)] = i
+    except RuntimeError as error:
+        print(f"key {i}: {error}")
+    print(f"kept: {sorted(colliding.values())}, length: {len(colliding)}")
+
+    cuckoo[None] = "none"
+    print(f"None key: {cuckoo[None]}, in keys: {None in list(cuckoo)}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # items: [(7, 'a'), (21, 'c'), (28, 'd'), (35, 'z')], 14 in map: False
+    # load: 0.90
+    # longest probe: 8 slots
+    # key 8: too many keys with the same hash
+    # kept: [0, 1, 2, 3, 4, 5, 6, 7], length: 8
+    # None key: none, in keys: True
+
+    ###########################################################################
@@ -1,23 +1,43 @@
-from typing import List
+from collections import Counter
+from typing import Any, Iterable, Iterator, List, Mapping
 from MapBase import MapBase, K, V
 import random
 from UnsortedMap import UnsortedMap
 
 
 class HashMapBase(MapBase):
-    """Map base class using a hash table."""
+    """Map base class using a hash table.
 
-    def __init__(self, cap=7, prime=1_999_999_777):
+    With incremental=True, growing the table doesn't rehash everything at once: the
+    old bucket array is kept next to the new one and every insertion or deletion
+    moves the bucket of its key plus the next _migrate_batch buckets over, so no
+    single operation pays for the whole resize. Reads look a key up in whichever
+    table holds its bucket and never move buckets, so iterating while reading values
+    is safe. It needs a table of buckets, i.e. every slot is None or a map of the
+    items hashed to it.
+    """
+
+    _migrate_batch = 4  # old buckets moved per operation while resizing
+    _max_load = 0.5  # largest number of items per slot before the table grows
+
+    def __init__(self, cap=7, prime=1_999_999_777, incremental=False):
         """Create an empty hash table map."""
         self._table: List[None] | List[UnsortedMap] = cap * [None]
         self._n = 0
         self._prime = prime
         self._scale = 1 + random.randrange(prime - 1)
         self._shift = random.randrange(prime)
+        self._incremental = incremental
+        self._old_table: List[None] | List[UnsortedMap] | None = None
+        self._migrated = 0  # old buckets below this index have been moved
 
     def __len__(self) -> int:
         return self._n
 
+    def _hash_code(self, key: K) -> int:
+        """Return the MAD (multiply-add-divide) hash of key before compression."""
+        return (hash(key) * self._scale + self._shift) % self._prime
+
     def _hash(self, key: K) -> int:
         """Hash key using MAD (multiply-add-divide) method.
 
@@ -27,9 +47,7 @@ class HashMapBase(MapBase):
         Returns:
             (int): hashed key
         """
-        return ((hash(key) * self._scale + self._shift) % self._prime) % len(
-            self._table
-        )
+        return self._hash_code(key) % len(self._table)
 
     def __getitem__(self, key: K) -> V:
         """Return value associated with key (raise KeyError if not found).
@@ -40,6 +58,10 @@ class HashMapBase(MapBase):
         Returns:
             V: value associated with key
         """
+        if self._old_table is not None:
+            bucket = self._old_table[self._hash_code(key) % len(self._old_table)]
+            if bucket is not None:
+                return bucket[key]
         hashed = self._hash(key)
         return self._bucket_getitem(hashed, key)
 
@@ -50,9 +72,11 @@ class HashMapBase(MapBase):
             key (K): key to assign value to
             value (V): value to assign to key
         """
+        if self._old_table is not None:
+            self._migrate_key(key)
         hashed = self._hash(key)
         self._bucket_setitem(hashed, key, value)
-        if self._n > (len(self._table) // 2):
+        if self._n > len(self._table) * self._max_load:
             self._resize()
 
     def __delitem__(self, key: K) -> None:
@@ -61,14 +85,168 @@ class HashMapBase(MapBase):
         Args:
             key (K): key to delete value of
         """
+        if self._old_table is not None:
+            self._migrate_key(key)
         hashed = self._hash(key)
         self._bucket_delitem(hashed, key)
 
-    def _resize(self):
-        """Resize bucket array to a new capacity."""
+    def _resize(self, new_cap: int | None = None):
+        """Resize bucket array to a new capacity (by default about twice as large)."""
+        if new_cap is None:
+            new_cap = 2 * len(self._table) - 1
+        if self._incremental:
+            if self._old_table is not None:
+                self._finish_migration()
+            self._old_table = self._table
+            self._table = [None] * new_cap
+            self._migrated = 0
+            return
         old = list(self.items())
-        new_cap = 2 * len(self._table) - 1
         self._table = [None] * new_cap
         self._n = 0
+        # insert into buckets directly, so no nested resize can be triggered
         for k, v in old:
-            self[k] = v
+            self._bucket_setitem(self._hash(k), k, v)
+
+    def _buckets(self) -> Iterator[UnsortedMap]:
+        """Generate every non-empty bucket, including those not yet migrated."""
+        for table in (self._old_table or [], self._table):
+            for bucket in table:
+                if bucket is not None:
+                    yield bucket
+
+    def _migrate_bucket(self, j: int) -> None:
+        """Move the items of old bucket j into the new table."""
+        bucket = self._old_table[j]
+        if bucket is None:
+            return
+        self._old_table[j] = None
+        self._n -= len(bucket)  # _bucket_setitem counts them again
+        for k, v in bucket.items():
+            self._bucket_setitem(self._hash(k), k, v)
+
+    def _migrate_key(self, key: K) -> None:
+        """Move the old bucket of key and the next batch of old buckets."""
+        self._migrate_bucket(self._hash_code(key) % len(self._old_table))
+        end = min(self._migrated + self._migrate_batch, len(self._old_table))
+        for j in range(self._migrated, end):
+            self._migrate_bucket(j)
+        self._migrated = end
+        if end == len(self._old_table):
+            self._old_table = None
+
+    def _finish_migration(self) -> None:
+        """Move all remaining old buckets."""
+        for j in range(self._migrated, len(self._old_table)):
+            self._migrate_bucket(j)
+        self._old_table = None
+
+    def _capacity_for(self, size: int) -> int:
+        """Return the smallest capacity that holds size items without resizing."""
+        return max(7, int(size / self._max_load) + 1)
+
+    def reserve(self, expected_size: int) -> None:
+        """Grow the table at once so that expected_size items fit without resizing.
+
+        Args:
+            expected_size (int): Total number of items the map will hold.
+        """
+        cap = self._capacity_for(expected_size)
+        if cap > len(self._table):
+            self._resize(cap)
+            if self._old_table is not None:
+                self._finish_migration()
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Mapping[K, V] | Iterable[tuple[K, V]],
+        expected_size: int | None = None,
+        **kwargs: Any,
+    ) -> "HashMapBase":
+        """Build a map sized up front for all items.
+
+        Args:
+            items (Mapping[K, V] | Iterable[tuple[K, V]]): Mapping or (key, value) pairs.
+            expected_size (int | None): Number of items, len(items) by default.
+            **kwargs (Any): Further arguments of the map class, e.g. prime.
+
+        Returns:
+            (HashMapBase): The new map.
+        """
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)
+        mapping = cls(**kwargs)
+        mapping.reserve(expected_size or 0)
+        mapping.update_many(items)
+        return mapping
+
+    def _set_all(self, pairs: Iterable[tuple[K, V]]) -> None:
+        """Insert pairs in one loop, resizing only if the table runs full."""
+        if self._old_table is not None:
+            self._finish_migration()
+        hash_code, setitem = self._hash_code, self._bucket_setitem
+        cap = len(self._table)
+        for k, v in pairs:
+            setitem(hash_code(k) % cap, k, v)
+            if self._n > cap * self._max_load:
+                self.reserve(2 * self._n)
+                cap = len(self._table)
+
+    def update_many(self, items: Mapping[K, V] | Iterable[tuple[K, V]]) -> None:
+        """Insert every item of a mapping or iterable of (key, value) pairs.
+
+        The table is grown once for all items when their number is known.
+        """
+        if isinstance(items, Mapping):
+            self.reserve(len(self) + len(items))
+            self._set_all((k, items[k]) for k in items)
+            return
+        if hasattr(items, "__len__"):
+            self.reserve(len(self) + len(items))
+        self._set_all(items)
+
+    def set_many(self, keys: Iterable[K], values: Iterable[V]) -> None:
+        """Assign values to keys pairwise."""
+        if hasattr(keys, "__len__"):
+            self.reserve(len(self) + len(keys))
+        self._set_all(zip(keys, values))
+
+    def get_many(self, keys: Iterable[K], default: V | None = None) -> list[V | None]:
+        """Return the value of every key, default for keys not in the map."""
+        if self._old_table is not None:
+            return [self.get(k, default) for k in keys]
+        hash_code, getitem = self._hash_code, self._bucket_getitem
+        cap = len(self._table)
+        values = []
+        for k in keys:
+            try:
+                values.append(getitem(hash_code(k) % cap, k))
+            except KeyError:
+                values.append(default)
+        return values
+
+    def delete_many(self, keys: Iterable[K]) -> None:
+        """Remove every key.
+
+        Raises:
+            KeyError: If a key is not found; the keys before it are removed.
+        """
+        if self._old_table is not None:
+            self._finish_migration()
+        hash_code, delitem = self._hash_code, self._bucket_delitem
+        for k in keys:
+            delitem(hash_code(k) % len(self._table), k)
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        """Generate, for every key, the number of slots inspected to find it."""
+        raise NotImplementedError("must be implemented by subclass")
+
+    def probe_lengths(self) -> dict[int, int]:
+        """Return the distribution of successful search lengths.
+
+        Returns:
+            (dict[int, int]): Number of keys found after inspecting 1, 2, 3, ... slots
+                or chain entries, by increasing length.
+        """
+        return dict(sorted(Counter(self._probe_length_iter()).items()))
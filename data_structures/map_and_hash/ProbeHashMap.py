@@ -0,0 +1,190 @@
+from HashMapBase import HashMapBase
+from MapBase import K, V
+from typing import Iterator
+
+_EMPTY = object()  # marks a free slot, so that None can be a key
+_AVAIL = object()  # marks a slot whose item was deleted (tombstone)
+
+
+class ProbeHashMap(HashMapBase):
+    """Hash map implementation with open addressing for collision resolution.
+
+    Keys and values live in two flat parallel lists, _table and _values, so no
+    per-bucket objects are allocated. A collision probes further slots of the same
+    table, either linearly (j, j + 1, j + 2, ...) or quadratically
+    (j, j + 1, j + 3, j + 6, ...). Deleted keys leave a tombstone that keeps probe
+    sequences intact; once tombstones fill a quarter of the table, it's rebuilt in
+    place to clear them.
+    """
+
+    def __init__(self, cap=7, prime=1_999_999_777, probing: str = "linear"):
+        """Create an empty hash table map.
+
+        Args:
+            cap (int): Initial number of slots.
+            prime (int): Prime of the MAD hash.
+            probing (str): "linear" or "quadratic".
+
+        Raises:
+            ValueError: If probing isn't "linear" or "quadratic".
+        """
+        if probing not in ("linear", "quadratic"):
+            raise ValueError(f"unknown probing {probing!r}")
+        super().__init__(cap, prime)
+        self._table = cap * [_EMPTY]
+        self._values: list = cap * [None]
+        self._deleted = 0  # number of tombstones
+        self._quadratic = probing == "quadratic"
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hash map."""
+        items = ", ".join(f"({key}, {self._values[j]})" for key, j in self._slots())
+        return f"\n[{items}]\nLength: {len(self._table)}\n"
+
+    def _find_slot(self, hashed: int, key: K) -> tuple[bool, int]:
+        """Search for key in the probe sequence starting at slot hashed.
+
+        Returns:
+            (tuple[bool, int]): (True, slot of key) if key is found, otherwise
+                (False, first free slot of its probe sequence).
+        """
+        table = self._table
+        cap = len(table)
+        avail = -1
+        j, step, quadratic = hashed, 0, self._quadratic
+        for _ in range(cap):
+            slot_key = table[j]
+            if slot_key is _EMPTY:
+                return (False, j if avail < 0 else avail)
+            if slot_key is _AVAIL:
+                if avail < 0:
+                    avail = j
+            elif slot_key == key:
+                return (True, j)
+            if quadratic:
+                step += 1
+                j = (j + step) % cap
+            else:
+                j = j + 1 if j + 1 < cap else 0
+        # quadratic probing needn't visit every slot, finish with a linear scan
+        for j in range(cap):
+            slot_key = table[j]
+            if slot_key is not _EMPTY and slot_key is not _AVAIL and slot_key == key:
+                return (True, j)
+        if avail < 0:
+            avail = next(
+                j for j in range(cap) if table[j] is _EMPTY or table[j] is _AVAIL
+            )
+        return (False, avail)
+
+    def _bucket_getitem(self, hashed: int, key: K) -> V:
+        """Return the value associated with key in the probe sequence of hashed.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        found, j = self._find_slot(hashed, key)
+        if not found:
+            raise KeyError("Key Error: " + repr(key))
+        return self._values[j]
+
+    def _bucket_setitem(self, hashed: int, key: K, value: V) -> None:
+        """Set the value for key in the probe sequence of hashed."""
+        found, j = self._find_slot(hashed, key)
+        if not found:
+            if self._table[j] is _AVAIL:
+                self._deleted -= 1
+            self._table[j] = key
+            self._n += 1
+        self._values[j] = value
+
+    def _bucket_delitem(self, hashed: int, key: K) -> None:
+        """Replace the item with key by a tombstone.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        found, j = self._find_slot(hashed, key)
+        if not found:
+            raise KeyError("Key Error: " + repr(key))
+        self._table[j] = _AVAIL
+        self._values[j] = None
+        self._n -= 1
+        self._deleted += 1
+        if self._deleted > len(self._table) // 4:
+            self._rehash(len(self._table))
+
+    def _slots(self) -> Iterator[tuple[K, int]]:
+        """Generate (key, slot) of every item."""
+        for j, key in enumerate(self._table):
+            if key is not _EMPTY and key is not _AVAIL:
+                yield key, j
+
+    def __iter__(self) -> Iterator[K]:
+        for key, _ in self._slots():
+            yield key
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        table = self._table
+        cap = len(table)
+        for key, slot in self._slots():
+            j, step, length = self._hash(key), 0, 1
+            while j != slot and length <= cap:
+                if self._quadratic:
+                    step += 1
+                    j = (j + step) % cap
+                else:
+                    j = j + 1 if j + 1 < cap else 0
+                length += 1
+            # past cap slots the key was found by the final linear scan
+            yield length if j == slot else cap + slot + 1
+
+    def _rehash(self, cap: int) -> None:
+        """Reinsert every item into empty tables of cap slots, dropping tombstones."""
+        old = [(key, self._values[j]) for key, j in self._slots()]
+        self._table = cap * [_EMPTY]
+        self._values = cap * [None]
+        self._n = 0
+        self._deleted = 0
+        for key, value in old:
+            self._bucket_setitem(self._hash(key), key, value)
+
+    def _resize(self, new_cap: int | None = None):
+        """Resize both flat arrays to a new capacity."""
+        self._rehash(new_cap or 2 * len(self._table) - 1)
+
+
+if __name__ == "__main__":
+    probe = ProbeHashMap()
+    probe[1] = "a"
+    probe[2] = "b"
+    probe[3] = "c"
+    probe[4] = "d"
+    probe[5] = "e"
+    print(f"key: 1, value: {probe[1]}, length: {len(probe)}")
+
+    probe[5] = "z"
+    del probe[2]
+    print(f"after update and delete: {sorted(probe.items())}")
+    print(f"2 in map: {2 in probe}")
+
+    quadratic = ProbeHashMap(probing="quadratic")
+    for i in range(100):
+        quadratic[f"key{i}"] = i
+    for i in range(0, 100, 2):
+        del quadratic[f"key{i}"]
+    print(f"quadratic: {len(quadratic)} keys, key51 -> {quadratic['key51']}")
+
+    probe[None] = "none"
+    print(f"None key: {probe[None]}, in keys: {None in list(probe)}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # key: 1, value: a, length: 5
+    # after update and delete: [(1, 'a'), (3, 'c'), (4, 'd'), (5, 'z')]
+    # 2 in map: False
+    # quadratic: 50 keys, key51 -> 51
+    # None key: none, in keys: True
+
+    ###########################################################################
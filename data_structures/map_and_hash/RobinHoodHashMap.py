@@ -0,0 +1,156 @@
+from array import array
+from typing import Iterator
+
+from HashMapBase import HashMapBase
+from MapBase import K, V
+
+
+class RobinHoodHashMap(HashMapBase):
+    """Hash map with Robin Hood linear probing and backward-shift deletion.
+
+    Every slot records the distance of its key from the key's home slot. A key being
+    inserted takes the slot of any key closer to home than itself, which then moves
+    on instead, so distances stay short and even at high load. A search stops as soon
+    as it meets a key closer to home than the searched one would be. A deletion
+    shifts the following displaced keys back by one slot instead of leaving a
+    tombstone.
+    """
+
+    def __init__(self, cap=7, prime=1_999_999_777, max_load: float = 0.9):
+        """Create an empty hash table map.
+
+        Args:
+            cap (int): Initial number of slots.
+            prime (int): Prime of the MAD hash.
+            max_load (float): Load factor above which the table grows, below 1.
+
+        Raises:
+            ValueError: If max_load isn't in (0, 1).
+        """
+        if not 0 < max_load < 1:
+            raise ValueError("max_load must be between 0 and 1")
+        super().__init__(cap, prime)
+        self._max_load = max_load
+        self._values: list = cap * [None]
+        self._dist = array("l", [-1]) * cap  # distance from home slot, -1 if empty
+
+    def __repr__(self) -> str:
+        """Return a string representation of the hash map."""
+        items = ", ".join(f"({key}, {self[key]})" for key in self)
+        return f"\n[{items}]\nLength: {len(self._table)}\n"
+
+    def _find(self, hashed: int, key: K) -> int:
+        """Return the slot of key, or -1 if key is not in the map."""
+        table, dist = self._table, self._dist
+        cap = len(table)
+        j, d = hashed, 0
+        while dist[j] >= d:
+            if table[j] == key:
+                return j
+            j = j + 1 if j + 1 < cap else 0
+            d += 1
+        return -1
+
+    def _bucket_getitem(self, hashed: int, key: K) -> V:
+        """Return the value associated with key in the probe sequence of hashed.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        j = self._find(hashed, key)
+        if j < 0:
+            raise KeyError("Key Error: " + repr(key))
+        return self._values[j]
+
+    def _bucket_setitem(self, hashed: int, key: K, value: V) -> None:
+        """Set the value for key, displacing keys closer to their home slot."""
+        table, values, dist = self._table, self._values, self._dist
+        cap = len(table)
+        j, d = hashed, 0
+        while dist[j] >= 0:
+            if dist[j] == d and table[j] == key:
+                values[j] = value
+                return
+            if dist[j] < d:
+                break
+            j = j + 1 if j + 1 < cap else 0
+            d += 1
+        self._n += 1
+        # key is new: place it at j and carry the evicted item further
+        while dist[j] >= 0:
+            table[j], key = key, table[j]
+            values[j], value = value, values[j]
+            dist[j], d = d, dist[j]
+            j = j + 1 if j + 1 < cap else 0
+            d += 1
+        table[j], values[j], dist[j] = key, value, d
+
+    def _bucket_delitem(self, hashed: int, key: K) -> None:
+        """Remove key and shift the displaced keys after it one slot back.
+
+        Raises:
+            KeyError: If key is not in the map.
+        """
+        j = self._find(hashed, key)
+        if j < 0:
+            raise KeyError("Key Error: " + repr(key))
+        table, values, dist = self._table, self._values, self._dist
+        cap = len(table)
+        nxt = j + 1 if j + 1 < cap else 0
+        while dist[nxt] > 0:
+            table[j], values[j], dist[j] = table[nxt], values[nxt], dist[nxt] - 1
+            j, nxt = nxt, nxt + 1 if nxt + 1 < cap else 0
+        table[j], values[j], dist[j] = None, None, -1
+        self._n -= 1
+
+    def __iter__(self) -> Iterator[K]:
+        for j in range(len(self._table)):
+            if self._dist[j] >= 0:
+                yield self._table[j]
+
+    def _probe_length_iter(self) -> Iterator[int]:
+        for d in self._dist:
+            if d >= 0:
+                yield d + 1
+
+    def _resize(self, new_cap: int | None = None):
+        """Reinsert every item into tables of a new capacity."""
+        old = [
+            (self._table[j], self._values[j])
+            for j in range(len(self._table))
+            if self._dist[j] >= 0
+        ]
+        cap = new_cap or 2 * len(self._table) - 1
+        self._table = cap * [None]
+        self._values = cap * [None]
+        self._dist = array("l", [-1]) * cap
+        self._n = 0
+        for k, v in old:
+            self._bucket_setitem(self._hash(k), k, v)
+
+
+if __name__ == "__main__":
+    robin = RobinHoodHashMap()
+    for i in range(1, 6):
+        robin[i * 7] = chr(ord("a") + i - 1)
+    robin[35] = "z"
+    del robin[14]
+    print(f"items: {sorted(robin.items())}, 14 in map: {14 in robin}")
+
+    # presized for 90% load
+    robin = RobinHoodHashMap(max_load=0.9)
+    robin.reserve(9_000)
+    robin.update_many((str(i), i) for i in range(9_000))
+    print(f"load: {len(robin) / len(robin._table):.2f}")
+    lengths = robin.probe_lengths()  # the exact counts depend on the random hash
+    mean = sum(length * count for length, count in lengths.items()) / len(robin)
+    print(f"keys probed: {sum(lengths.values())}, mean probe below 10: {mean < 10}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # items: [(7, 'a'), (21, 'c'), (28, 'd'), (35, 'z')], 14 in map: False
+    # load: 0.90
+    # keys probed: 9000, mean probe below 10: True
+
+    ###########################################################################
@@ -0,0 +1,426 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from functools import partial
+from typing import Callable, Sequence
+
+from ChainHashMap import ChainHashMap
+from CompactChainHashMap import CompactChainHashMap
+from ConcurrentHashMap import ConcurrentHashMap
+from CuckooHashMap import CuckooHashMap
+from HashMapBase import HashMapBase
+from ProbeHashMap import ProbeHashMap
+from RobinHoodHashMap import RobinHoodHashMap
+
+Factory = Callable[..., HashMapBase]
+
+# name -> factory of an empty map, a map class or a partial of one
+MAPS: dict[str, Factory] = {
+    "ChainHashMap": ChainHashMap,
+    "ChainHashMap-incremental": partial(ChainHashMap, incremental=True),
+    "CompactChainHashMap": CompactChainHashMap,
+    "ProbeHashMap-linear": partial(ProbeHashMap, probing="linear"),
+    "ProbeHashMap-quadratic": partial(ProbeHashMap, probing="quadratic"),
+    "RobinHoodHashMap": RobinHoodHashMap,
+    "CuckooHashMap": CuckooHashMap,
+}
+
+
+def build(factory: Factory, keys: Sequence) -> tuple[HashMapBase, int]:
+    """Insert every key into a new map and return it with the bytes it allocated.
+
+    The keys themselves are allocated before tracing starts, so only the memory of
+    the table, buckets and entries is counted.
+
+    Args:
+        factory (Factory): Creates the empty map.
+        keys (Sequence): Keys to be inserted, each mapped to itself.
+
+    Returns:
+        (tuple[HashMapBase, int]): The map and its allocated bytes.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        mapping = factory()
+        for key in keys:
+            mapping[key] = key
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return mapping, allocated
+
+
+def time_lookups(mapping: HashMapBase, keys: Sequence) -> float:
+    """Return the number of lookups per second for all keys (hits and misses)."""
+    start = time.perf_counter()
+    for key in keys:
+        key in mapping
+    elapsed = time.perf_counter() - start
+    return len(keys) / elapsed if elapsed > 0 else float("inf")
+
+
+def percentile(samples: Sequence[int], p: float) -> int:
+    """Return the p-th percentile (nearest rank) of sorted samples."""
+    if not samples:
+        return 0
+    rank = max(0, min(len(samples) - 1, int(round(p / 100 * len(samples))) - 1))
+    return samples[rank]
+
+
+def setitem_latencies(factory: Factory, keys: Sequence, windows: int) -> list[dict]:
+    """Time every insertion of keys into a new map, summarized per growth window.
+
+    The cyclic garbage collector is paused meanwhile, like timeit does, so its full
+    collections aren't mistaken for resize pauses.
+
+    Args:
+        factory (Factory): Creates the empty map.
+        keys (Sequence): Keys to be inserted, each mapped to itself.
+        windows (int): Number of equal slices of the insertions to summarize.
+
+    Returns:
+        (list[dict]): Per window, the size reached and latency percentiles in ns.
+    """
+    clock = time.perf_counter_ns
+    mapping = factory()
+    samples = []
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for key in keys:
+            start = clock()
+            mapping[key] = key
+            samples.append(clock() - start)
+    finally:
+        if enabled:
+            gc.enable()
+    rows = []
+    width = max(1, len(keys) // windows)
+    for lo in range(0, len(keys), width):
+        window = sorted(samples[lo : lo + width])
+        rows.append(
+            {
+                "size": lo + len(window),
+                "p50_ns": percentile(window, 50),
+                "p99_ns": percentile(window, 99),
+                "p99.9_ns": percentile(window, 99.9),
+                "max_ns": window[-1],
+            }
+        )
+    return rows
+
+
+def run_latency(
+    maps: dict[str, Factory], n: int, windows: int = 10, seed: int = 0
+) -> list[dict]:
+    """Measure __setitem__ latency of every map while it grows to n keys.
+
+    Returns:
+        (list[dict]): One result row per (map, window).
+    """
+    keys = random.Random(f"{seed}-{n}").sample(range(4 * n), n)
+    results = []
+    for name, factory in maps.items():
+        for row in setitem_latencies(factory, keys, windows):
+            results.append({"map": name, **row})
+    return results
+
+
+def time_builds(factory: Factory, pairs: list) -> tuple[float, float]:
+    """Return the seconds to build a map from pairs one by one and with from_items."""
+    start = time.perf_counter()
+    mapping = factory()
+    for k, v in pairs:
+        mapping[k] = v
+    one_by_one = time.perf_counter() - start
+    del mapping
+    if isinstance(factory, partial):
+        cls, kwargs = factory.func, factory.keywords
+    else:
+        cls, kwargs = factory, {}
+    start = time.perf_counter()
+    mapping = cls.from_items(pairs, **kwargs)
+    bulk = time.perf_counter() - start
+    return one_by_one, bulk
+
+
+def run_builds(
+    maps: dict[str, Factory], sizes: Sequence[int], seed: int = 0
+) -> list[dict]:
+    """Compare one-by-one insertion with from_items for every map at every size.
+
+    Returns:
+        (list[dict]): One result row per (map, size).
+    """
+    results = []
+    for n in sizes:
+        rng = random.Random(f"{seed}-{n}")
+        pairs = [(key, key) for key in rng.sample(range(4 * n), n)]
+        for name, factory in maps.items():
+            one_by_one, bulk = time_builds(factory, pairs)
+            results.append(
+                {"map": name, "size": n, "insert_s": one_by_one, "from_items_s": bulk}
+            )
+    return results
+
+
+def _global_lock_ops(n: int) -> tuple[Callable, Callable]:
+    """Return get and set of a ChainHashMap guarded by one lock."""
+    mapping = ChainHashMap.from_items((key, key) for key in range(n))
+    lock = threading.Lock()
+
+    def get(key):
+        with lock:
+            return mapping.get(key)
+
+    def put(key, value):
+        with lock:
+            mapping[key] = value
+
+    return get, put
+
+
+def _striped_ops(n: int) -> tuple[Callable, Callable]:
+    """Return get and set of a ConcurrentHashMap."""
+    mapping = ConcurrentHashMap.from_items((key, key) for key in range(n))
+    return mapping.get, mapping.__setitem__
+
+
+# name -> function creating a map of n keys and returning its (get, set) operations
+CONCURRENT: dict[str, Callable[[int], tuple[Callable, Callable]]] = {
+    "ChainHashMap+global-lock": _global_lock_ops,
+    "ConcurrentHashMap": _striped_ops,
+}
+
+
+def run_concurrent(
+    n: int,
+    ops: int,
+    thread_counts: Sequence[int] = (1, 4, 16),
+    seed: int = 0,
+) -> list[dict]:
+    """Measure total throughput of threads sharing one map of n keys.
+
+    Every thread runs ops operations on random keys, 90% gets and 10% sets.
+
+    Returns:
+        (list[dict]): One result row per (map, thread count).
+    """
+    results = []
+    for name, make in CONCURRENT.items():
+        for threads in thread_counts:
+            get, put = make(n)
+            work = [
+                [random.Random(f"{seed}-{t}").randrange(2 * n) for _ in range(ops)]
+                for t in range(threads)
+            ]
+            barrier = threading.Barrier(threads + 1)
+
+            def worker(keys: list) -> None:
+                barrier.wait()
+                for i, key in enumerate(keys):
+                    if i % 10:
+                        get(key)
+                    else:
+                        put(key, i)
+
+            pool = [threading.Thread(target=worker, args=(w,)) for w in work]
+            for thread in pool:
+                thread.start()
+            barrier.wait()
+            start = time.perf_counter()
+            for thread in pool:
+                thread.join()
+            elapsed = time.perf_counter() - start
+            results.append(
+                {
+                    "map": name,
+                    "threads": threads,
+                    "ops_per_sec": threads * ops / elapsed,
+                }
+            )
+    return results
+
+
+def run_probes(
+    maps: dict[str, Factory], n: int, load: float | None = None, seed: int = 0
+) -> list[dict]:
+    """Summarize the probe-length distribution of every map holding n string keys.
+
+    Args:
+        maps (dict[str, Factory]): Maps to be measured.
+        n (int): Number of keys.
+        load (float | None): Load factor to presize for; maps whose maximum load is
+            lower grow past it. By default maps grow on their own.
+        seed (int): Seed of the random key generator.
+
+    Returns:
+        (list[dict]): One result row per map.
+    """
+    rng = random.Random(f"{seed}-{n}")
+    keys = [f"key-{rng.getrandbits(64):016x}" for _ in range(n)]
+    results = []
+    for name, factory in maps.items():
+        mapping = factory()
+        if load is not None:
+            mapping.reserve(int(n * mapping._max_load / load))
+        mapping.update_many((key, None) for key in keys)
+        lengths = mapping.probe_lengths()
+        samples = [length for length, count in lengths.items() for _ in range(count)]
+        results.append(
+            {
+                "map": name,
+                "size": n,
+                "load": len(mapping) / len(mapping._table),
+                "mean_probes": sum(samples) / len(samples),
+                "p99_probes": percentile(samples, 99),
+                "max_probes": samples[-1],
+                "distribution": lengths,
+            }
+        )
+    return results
+
+
+def run(
+    maps: dict[str, Factory], sizes: Sequence[int], lookups: int, seed: int = 0
+) -> list[dict]:
+    """Measure memory per key and lookup throughput of every map at every size.
+
+    Half of the lookups are hits. Inputs are generated from the seed, so runs with
+    the same arguments insert and search the same keys.
+
+    Args:
+        maps (dict[str, Factory]): Maps to be benchmarked.
+        sizes (Sequence[int]): Numbers of keys.
+        lookups (int): Number of keys searched per (map, size).
+        seed (int): Seed of the random input generator.
+
+    Returns:
+        (list[dict]): One result row per (map, size).
+    """
+    results = []
+    for n in sizes:
+        rng = random.Random(f"{seed}-{n}")
+        keys = rng.sample(range(4 * n), n)
+        probes = [
+            rng.choice(keys) if rng.random() < 0.5 else rng.randrange(4 * n, 8 * n)
+            for _ in range(lookups)
+        ]
+        for name, factory in maps.items():
+            mapping, allocated = build(factory, keys)
+            results.append(
+                {
+                    "map": name,
+                    "size": n,
+                    "bytes_per_key": allocated / n,
+                    "lookups_per_sec": time_lookups(mapping, probes),
+                }
+            )
+            del mapping
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark hash maps.")
+    parser.add_argument("--min-exp", type=int, default=3, help="smallest size, 10^x")
+    parser.add_argument("--max-exp", type=int, default=5, help="largest size, 10^x")
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--map", action="append", choices=list(MAPS))
+    parser.add_argument(
+        "--latency",
+        action="store_true",
+        help="time every __setitem__ while growing to 10^max-exp keys instead",
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="measure shared-map throughput at 1, 4 and 16 threads instead",
+    )
+    parser.add_argument(
+        "--probes",
+        action="store_true",
+        help="report probe lengths at 10^max-exp string keys instead",
+    )
+    parser.add_argument(
+        "--load", type=float, help="with --probes, presize maps for this load"
+    )
+    parser.add_argument(
+        "--build",
+        action="store_true",
+        help="compare one-by-one insertion with from_items instead",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", help="write results as JSON ('-' for stdout)"
+    )
+    args = parser.parse_args()
+
+    maps = {name: MAPS[name] for name in args.map or MAPS}
+    sizes = [10**e for e in range(args.min_exp, args.max_exp + 1)]
+    if args.latency:
+        results = run_latency(maps, sizes[-1], seed=args.seed)
+    elif args.build:
+        results = run_builds(maps, sizes, args.seed)
+    elif args.probes:
+        results = run_probes(maps, sizes[-1], args.load, args.seed)
+    elif args.threads:
+        results = run_concurrent(sizes[-1], args.lookups, seed=args.seed)
+    else:
+        results = run(maps, sizes, args.lookups, args.seed)
+
+    if args.json:
+        report = {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "lookups": args.lookups,
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w") as out:
+                json.dump(report, out, indent=2)
+    elif args.latency:
+        for row in results:
+            print(
+                f"{row['map']:<25} n={row['size']:<10} "
+                f"p50={row['p50_ns']:>7,} ns p99={row['p99_ns']:>8,} ns "
+                f"p99.9={row['p99.9_ns']:>9,} ns max={row['max_ns']:>13,} ns"
+            )
+    elif args.probes:
+        for row in results:
+            print(
+                f"{row['map']:<25} n={row['size']:<10} load={row['load']:.2f} "
+                f"mean={row['mean_probes']:.2f} p99={row['p99_probes']} "
+                f"max={row['max_probes']} probes"
+            )
+    elif args.threads:
+        print(f"free-threaded: {not getattr(sys, '_is_gil_enabled', lambda: True)()}")
+        for row in results:
+            print(
+                f"{row['map']:<25} threads={row['threads']:<3} "
+                f"{row['ops_per_sec']:>12,.0f} ops/s"
+            )
+    elif args.build:
+        for row in results:
+            print(
+                f"{row['map']:<25} n={row['size']:<10} "
+                f"insert {row['insert_s']:>8.3f} s  "
+                f"from_items {row['from_items_s']:>8.3f} s"
+            )
+    else:
+        for row in results:
+            print(
+                f"{row['map']:<25} n={row['size']:<10} "
+                f"{row['bytes_per_key']:>8.1f} bytes/key "
+                f"{row['lookups_per_sec']:>12,.0f} lookups/s"
+            )
@@ -0,0 +1,180 @@
+import heapq
+import math
+from array import array
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, batch queries then return lists
+    np = None
+
+
+class KDTree:
+    """Array-backed k-d tree for nearest-neighbour and orthogonal range search.
+
+    The tree is implicit: points are reordered so that the root of every subtree
+    range [lo, hi) is the median at mid = (lo + hi) // 2 along the splitting axis of
+    its depth, with the left subtree in [lo, mid) and the right one in [mid + 1, hi).
+    No node objects are allocated; queries report indices into the original points.
+    """
+
+    __slots__ = ("_points", "_ids", "_dims")
+
+    def __init__(self, points: Iterable[Sequence[float]]) -> None:
+        """Build a balanced tree by median splits.
+
+        Time complexity: O(n log^2(n))
+
+        Args:
+            points (Iterable[Sequence[float]]): Points of equal dimension; a numpy array
+                of shape (n, k) works too.
+
+        Raises:
+            ValueError: If the points are zero-dimensional or of different dimensions.
+        """
+        if np is not None and isinstance(points, np.ndarray):
+            points = points.tolist()
+        pts = [tuple(p) for p in points]
+        self._dims = len(pts[0]) if pts else 0
+        if pts and self._dims == 0:
+            raise ValueError("points must have at least one dimension")
+        if any(len(p) != self._dims for p in pts):
+            raise ValueError("all points must have the same dimension")
+        order = list(range(len(pts)))
+        self._build(pts, order, 0, len(order), 0)
+        self._points = [pts[i] for i in order]
+        self._ids = array("q", order)
+
+    def _build(self, pts: list, order: list, lo: int, hi: int, depth: int) -> None:
+        """Arrange order[lo:hi] so that its middle is the median along the depth's axis."""
+        if hi - lo <= 1:
+            return
+        axis = depth % self._dims
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: pts[i][axis])
+        mid = (lo + hi) // 2
+        self._build(pts, order, lo, mid, depth + 1)
+        self._build(pts, order, mid + 1, hi, depth + 1)
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self._points)
+
+    def nearest(self, query: Sequence[float], k: int = 1) -> list[tuple[float, int]]:
+        """Return the k points closest to query (Euclidean distance).
+
+        Time complexity: O(log(n)) expected for well spread points.
+
+        Args:
+            query (Sequence[float]): The query point.
+            k (int): Number of neighbours.
+
+        Returns:
+            (list[tuple[float, int]]): (distance, index of point) by increasing distance.
+        """
+        if len(query) != self._dims and self._points:
+            raise ValueError("query has the wrong dimension")
+        points, dims = self._points, self._dims
+        best: list[tuple[float, int]] = []  # max-heap of (-squared distance, position)
+
+        def visit(lo: int, hi: int, depth: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            point = points[mid]
+            dist = sum((a - b) * (a - b) for a, b in zip(point, query))
+            if len(best) < k:
+                heapq.heappush(best, (-dist, mid))
+            elif dist < -best[0][0]:
+                heapq.heapreplace(best, (-dist, mid))
+            axis = depth % dims
+            diff = query[axis] - point[axis]
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+            visit(*near, depth + 1)
+            # the far side can only help if the splitting plane is within reach
+            if len(best) < k or diff * diff < -best[0][0]:
+                visit(*far, depth + 1)
+
+        if k > 0:
+            visit(0, len(points), 0)
+        ranked = sorted(best, reverse=True)
+        return [(math.sqrt(-dist), self._ids[pos]) for dist, pos in ranked]
+
+    def range_search(self, low: Sequence[float], high: Sequence[float]) -> list[int]:
+        """Return the indices of points p with low[d] <= p[d] <= high[d] on every axis.
+
+        Time complexity: O(n^(1 - 1/k) + r) for r reported points.
+        """
+        points, dims, found = self._points, self._dims, []
+
+        def visit(lo: int, hi: int, depth: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            point = points[mid]
+            if all(low[d] <= point[d] <= high[d] for d in range(dims)):
+                found.append(self._ids[mid])
+            axis = depth % dims
+            if low[axis] <= point[axis]:
+                visit(lo, mid, depth + 1)
+            if point[axis] <= high[axis]:
+                visit(mid + 1, hi, depth + 1)
+
+        visit(0, len(points), 0)
+        return sorted(found)
+
+    def nearest_many(self, queries: Any, k: int = 1) -> tuple[Any, Any]:
+        """Return the k nearest neighbours of every query point.
+
+        Args:
+            queries (Any): Query points, e.g. a numpy array of shape (m, dims).
+            k (int): Number of neighbours; there must be at least k points.
+
+        Returns:
+            (tuple[Any, Any]): Distances and indices of shape (m, k), as numpy arrays if
+                numpy is available, otherwise as lists of lists.
+        """
+        if k > len(self._points):
+            raise ValueError("k is larger than the number of points")
+        if np is not None and isinstance(queries, np.ndarray):
+            queries = queries.tolist()
+        distances, indices = [], []
+        for query in queries:
+            result = self.nearest(query, k)
+            distances.append([d for d, _ in result])
+            indices.append([i for _, i in result])
+        if np is None:
+            return distances, indices
+        return (
+            np.array(distances, dtype=float).reshape(-1, k),
+            np.array(indices, dtype=np.intp).reshape(-1, k),
+        )
+
+    def range_search_many(self, lows: Any, highs: Any) -> list[list[int]]:
+        """Return range_search(low, high) for every pair of lows and highs."""
+        if np is not None:
+            lows = np.asarray(lows).tolist()
+            highs = np.asarray(highs).tolist()
+        return [self.range_search(low, high) for low, high in zip(lows, highs)]
+
+
+if __name__ == "__main__":
+    points = [(2, 3), (5, 4), (9, 6), (4, 7), (8, 1), (7, 2)]
+    tree = KDTree(points)
+    print(f"nearest to (9, 2): {tree.nearest((9, 2))}")
+    print(f"2 nearest to (3, 4): {tree.nearest((3, 4), k=2)}")
+    print(f"points in [4, 8] x [1, 5]: {tree.range_search((4, 1), (8, 5))}")
+    distances, indices = tree.nearest_many([(9, 2), (3, 4)], k=1)
+    print(f"batch nearest: {[list(map(int, row)) for row in indices]}")
+
+    ###########################################################################
+
+    # --------------------------------OUTPUT-----------------------------------
+    # nearest to (9, 2): [(1.4142135623730951, 4)]
+    # 2 nearest to (3, 4): [(1.4142135623730951, 0), (2.0, 1)]
+    # points in [4, 8] x [1, 5]: [1, 4, 5]
+    # batch nearest: [[4], [0]]
+
+    ###########################################################################